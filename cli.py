@@ -2,13 +2,48 @@
 
 import sys
 import argparse
+import atexit
 import logging
-from jira_client import JiraManager
+import functools
+from collections import defaultdict
+from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+__all__ = ['HELP_COMMANDS', 'command_metadata', 'command_path', 'display_help_summary', 'option_takes_value',
+           'setup_cli_parser']
+
 # Define help commands
-help_commands = ['help', '-h', '--help']
+HELP_COMMANDS = frozenset(('help', '-h', '--help'))
+
+# Jira command groups, in the order they are registered with argparse
+JIRA_GROUPS = {
+    'project': 'Manage Jira projects',
+    'task': 'Manage Jira tasks',
+}
+
+# Issue types accepted by the task commands
+TASK_TYPES = ('Task', 'Sub-task', 'Epic')
+
+# Options accepted by every Jira command, as (flag, argparse kwargs) pairs
+COMMON_OPTIONS = (
+    ('--no-cache', {'action': 'store_true', 'help': 'Bypass and refresh cached Jira data'}),
+)
+
+# Registry of CLI command handlers keyed by (category, name), filled in by @command_metadata
+COMMANDS = {}
+
+# The same handlers grouped by category, in registration order
+_COMMAND_GROUPS = {}
+
+@dataclass(frozen=True, slots=True)
+class CommandMeta:
+    """Metadata attached to a CLI command handler by @command_metadata."""
+    category: str
+    name: str
+    description: str
+    usage: str | None = None
+    options: tuple = ()
 
 def command_metadata(category, name, description, usage=None, options=None):
     """
@@ -19,19 +54,83 @@ def command_metadata(category, name, description, usage=None, options=None):
         name (str): The command name (e.g., 'list', 'create')
         description (str): A user-friendly description of the command
         usage (str, optional): Example usage of the command
-        options (list, optional): List of command options
+        options (list, optional): List of (flag, argparse keyword arguments) pairs
     """
     def decorator(func):
-        func.metadata = {
-            'category': category,
-            'name': name,
-            'description': description,
-            'usage': usage,
-            'options': options or []
-        }
+        func.metadata = CommandMeta(category, name, description, usage,
+                                    tuple(options) if options else ())
+        COMMANDS[(category, name)] = func
+        _COMMAND_GROUPS.setdefault(category, []).append(func)
         return func
     return decorator
 
+# JiraManager shared by all command handlers, created on first use
+_jira_manager = None
+
+def _jira(args):
+    """
+    Return the shared JiraManager, connecting to Jira on first use.
+
+    The manager's session is closed when the process exits.
+
+    Args:
+        args (argparse.Namespace): Parsed command-line arguments; --no-cache
+                                   makes the manager bypass its disk caches
+
+    Returns:
+        JiraManager: Connected Jira manager
+    """
+    global _jira_manager
+    if _jira_manager is None:
+        from jira_client import JiraManager
+
+        _jira_manager = JiraManager(use_cache=not getattr(args, 'no_cache', False))
+        # Registered before any refresh the manager starts, so it runs after
+        # that refresh's exit hook
+        atexit.register(_jira_manager.close)
+    return _jira_manager
+
+_HELP_HEADER = """\
+Jira CLI Tool Help
+=================
+"""
+
+@functools.lru_cache(maxsize=1)
+def _help_texts():
+    """
+    Build the help body for each context accepted by display_help_summary.
+
+    Returns:
+        dict: Help text keyed by context, with None holding the top-level usage
+    """
+    texts = {}
+    lines = ["", "Usage: jira [command] [subcommand] [options]", "", "Commands:"]
+    lines += [f"  jira {group:<10}{group_help}" for group, group_help in JIRA_GROUPS.items()]
+    lines += ["", "Use 'jira [command] --help' for more information about a command.", ""]
+    texts[None] = "\n".join(lines)
+
+    lines = ["", "Available Jira Commands:"]
+    lines += [f"  {group:<10}{group_help}" for group, group_help in JIRA_GROUPS.items()]
+    texts['jira'] = "\n".join(lines) + "\n"
+
+    for group in JIRA_GROUPS:
+        lines = ["", f"Jira {group.title()} Commands:"]
+        lines += [f"  {handler.metadata.name:<13}{handler.metadata.description}"
+                  for handler in _COMMAND_GROUPS.get(group, ())]
+        texts[f'jira {group}'] = "\n".join(lines) + "\n"
+
+    for handler in COMMANDS.values():
+        command = handler.metadata
+        lines = ["", f"Jira {command.category.title()} {command.name.title()} Command:",
+                 f"  {command.description}"]
+        if command.usage:
+            lines += ["", "Usage:", f"  ./main.py {command.usage}"]
+        lines += ["", "Options:"]
+        lines += [f"  {flag:<14}{kwargs.get('help', '')}" for flag, kwargs in command.options + COMMON_OPTIONS]
+        texts[f"jira {command.category} {command.name}"] = "\n".join(lines) + "\n"
+
+    return texts
+
 def display_help_summary(context=None):
     """
     Display a comprehensive help summary for the Jira CLI tool.
@@ -40,95 +139,42 @@ def display_help_summary(context=None):
         context (str, optional): Specific context to display help for
                                  (e.g., 'jira', 'jira project', 'jira task')
     """
-    print("Jira CLI Tool Help")
-    print("=================")
-
-    if context == 'jira':
-        print("\nAvailable Jira Commands:")
-        print("  project   Manage Jira projects")
-        print("  task      Manage Jira tasks")
-    elif context == 'jira project':
-        print("\nJira Project Commands:")
-        print("  list      List all Jira projects")
-        print("  create    Create a new Jira project")
-        print("  statuses  List available statuses for a Jira project")
-    elif context == 'jira project list':
-        print("\nJira Project List Command:")
-        print("  Lists all available Jira projects")
-        print("\nUsage:")
-        print("  ./main.py jira project list")
-    elif context == 'jira project create':
-        print("\nJira Project Create Command:")
-        print("  Creates a new Jira project")
-        print("\nUsage:")
-        print("  ./main.py jira project create --name 'Project Name' --key PROJ --type software")
-        print("\nOptions:")
-        print("  --name     Project name (required)")
-        print("  --key      Project key (required)")
-        print("  --type     Project type (optional, default: software)")
-    elif context == 'jira project statuses':
-        print("\nJira Project Statuses Command:")
-        print("  Lists available statuses for a Jira project")
-        print("\nUsage:")
-        print("  ./main.py jira project statuses [--project PROJECT_KEY]")
-        print("\nOptions:")
-        print("  --project     Project key (optional)")
-    elif context == 'jira task':
-        print("\nJira Task Commands:")
-        print("  create    Create a new Jira task")
-        print("  list      List tasks for a project")
-    elif context == 'jira task create':
-        print("\nJira Task Create Command:")
-        print("  Creates a new Jira task")
-        print("\nUsage:")
-        print("  ./main.py jira task create --project PROJ --summary 'Task Summary'")
-        print("\nOptions:")
-        print("  --project     Project key (required)")
-        print("  --summary     Task summary (required)")
-        print("  --description Task description (optional)")
-        print("  --type        Task type (optional, default: Task)")
-    elif context == 'jira task list':
-        print("\nJira Task List Command:")
-        print("  Lists tasks for a project with optional filters")
-        print("\nUsage:")
-        print("  ./main.py jira task list --project KEY [--assignee USER] [--status STATUS] [--labels LABEL1 LABEL2]")
-        print("\nOptions:")
-        print("  --project     Project key (required)")
-        print("  --assignee    Assignee (optional)")
-        print("  --status      Status (optional)")
-        print("  --labels      Labels (optional)")
-    else:
-        print("\nUsage: jira [command] [subcommand] [options]")
-        print("\nCommands:")
-        print("  jira project   Manage Jira projects")
-        print("  jira task      Manage Jira tasks")
-        print("\nUse 'jira [command] --help' for more information about a command.")
-
-    return
-
-
-@command_metadata('project', 'list', 'List all Jira projects')
+    texts = _help_texts()
+    sys.stdout.write(_HELP_HEADER + texts.get(context, texts[None]))
+
+
+@command_metadata('project', 'list', 'List all Jira projects',
+                  usage='jira project list')
 def handle_jira_project_list(args):
     """
     Handle the 'jira project list' command.
     """
+    from jira_client import JiraException
+
     try:
-        jira_manager = JiraManager()
+        jira_manager = _jira(args)
         projects = jira_manager.get_projects()
 
         if not projects:
             print("No projects found.")
             return
 
-        print("Jira Projects:")
-        for project in projects:
-            print(f"- {project['key']}: {project['name']}")
+        # One write: on a terminal stdout is line-buffered, so writing line
+        # by line would cost a syscall per project
+        sys.stdout.write("Jira Projects:\n" +
+                         "".join(f"- {project['key']}: {project['name']}\n" for project in projects))
     except JiraException as e:
-        logger.error(f"Error listing projects: {e}")
+        logger.error("Error listing projects: %s", e)
         print("Failed to list projects. Please check the logs for more details.")
 
 @command_metadata('project', 'create', 'Create a new Jira project',
-                  usage='jira project create --name "Project Name" --key PROJ --type software')
+                  usage='jira project create --name "Project Name" --key PROJ --type software',
+                  options=[
+                      ('--name', {'required': True, 'help': 'Project name (required)'}),
+                      ('--key', {'required': True, 'help': 'Project key (required, must be unique)'}),
+                      ('--type', {'default': 'software', 'choices': ('software', 'service'),
+                                  'help': 'Project type (optional, default: software)'}),
+                  ])
 def handle_jira_project_create(args):
     """
     Handle the 'jira project create' command.
@@ -136,8 +182,10 @@ def handle_jira_project_create(args):
     Args:
         args (argparse.Namespace): Parsed command-line arguments
     """
+    from jira_client import JiraException
+
     try:
-        jira_manager = JiraManager()
+        jira_manager = _jira(args)
         project = jira_manager.create_project(
             name=args.name,
             key=args.key,
@@ -145,17 +193,20 @@ def handle_jira_project_create(args):
         )
 
         if project:
-            print(f"Project created successfully:")
-            print(f"- Key: {project['key']}")
-            print(f"- Name: {project['name']}")
+            sys.stdout.write("Project created successfully:\n"
+                             f"- Key: {project['key']}\n"
+                             f"- Name: {project['name']}\n")
         else:
             print("Failed to create project.")
     except JiraException as e:
-        logger.error(f"Error creating project: {e}")
+        logger.error("Error creating project: %s", e)
         print("Failed to create project. Please check the logs for more details.")
 
 @command_metadata('project', 'statuses', 'List available statuses for a Jira project',
-                  usage='jira project statuses [--project PROJECT_KEY]')
+                  usage='jira project statuses [--project PROJECT_KEY]',
+                  options=[
+                      ('--project', {'help': 'Project key (optional)'}),
+                  ])
 def handle_jira_project_statuses(args):
     """
     Handle the 'jira project statuses' command.
@@ -164,39 +215,46 @@ def handle_jira_project_statuses(args):
         args (argparse.Namespace): Parsed command-line arguments
     """
     try:
-        jira_manager = JiraManager()
+        jira_manager = _jira(args)
         statuses = jira_manager.get_statuses(project_key=args.project)
 
         if not statuses:
             print("No statuses found.")
             return
 
-        print(f"Statuses{' for Project ' + args.project if args.project else ''}:")
+        header = f"Statuses for Project {args.project}:" if args.project else "Statuses:"
 
         # Group statuses by issue type
-        issue_type_statuses = {}
+        issue_type_statuses = defaultdict(list)
         for status in statuses:
-            issue_type = status.get('issue_type', 'Unknown')
-            if issue_type not in issue_type_statuses:
-                issue_type_statuses[issue_type] = []
-            issue_type_statuses[issue_type].append(status)
+            issue_type_statuses[status.get('issue_type', 'Unknown')].append(status)
 
         # Print statuses grouped by issue type
+        lines = [header]
         for issue_type, type_statuses in issue_type_statuses.items():
-            print(f"\n{issue_type} Issue Type Statuses:")
+            lines.append("")
+            lines.append(f"{issue_type} Issue Type Statuses:")
             for status in type_statuses:
-                print(f"- {status['id']} - {status['name']}")
+                lines.append(f"- {status['id']} - {status['name']}")
                 if status.get('description'):
-                    print(f"  Description: {status['description']}")
+                    lines.append(f"  Description: {status['description']}")
                 if status.get('category'):
-                    print(f"  Category: {status['category']}")
-            print()
+                    lines.append(f"  Category: {status['category']}")
+            lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
     except Exception as e:
-        logger.error(f"Error retrieving statuses: {e}")
+        logger.error("Error retrieving statuses: %s", e)
         print("Failed to retrieve statuses. Please check the logs for more details.")
 
 @command_metadata('task', 'create', 'Create a new Jira task',
-                  usage='jira task create --project PROJ --summary "Task Summary" --type Task')
+                  usage='jira task create --project PROJ --summary "Task Summary" --type Task',
+                  options=[
+                      ('--project', {'required': True, 'help': 'Project key (required)'}),
+                      ('--summary', {'required': True, 'help': 'Task summary (required)'}),
+                      ('--description', {'help': 'Task description (optional)'}),
+                      ('--type', {'default': 'Task', 'choices': TASK_TYPES,
+                                  'help': 'Task type (optional, default: Task)'}),
+                  ])
 def handle_jira_task_create(args):
     """
     Handle the 'jira task create' command.
@@ -204,8 +262,10 @@ def handle_jira_task_create(args):
     Args:
         args (argparse.Namespace): Parsed command-line arguments
     """
+    from jira_client import JiraException
+
     try:
-        jira_manager = JiraManager()
+        jira_manager = _jira(args)
         task = jira_manager.create_task(
             project_key=args.project,
             summary=args.summary,
@@ -214,18 +274,25 @@ def handle_jira_task_create(args):
         )
 
         if task:
-            print(f"Task created successfully:")
-            print(f"- Key: {task['key']}")
-            print(f"- Summary: {task['summary']}")
-            print(f"- Project: {task['project']}")
+            sys.stdout.write("Task created successfully:\n"
+                             f"- Key: {task['key']}\n"
+                             f"- Summary: {task['summary']}\n"
+                             f"- Project: {task['project']}\n")
         else:
             print("Failed to create task.")
     except JiraException as e:
-        logger.error(f"Error creating task: {e}")
+        logger.error("Error creating task: %s", e)
         print("Failed to create task. Please check the logs for more details.")
 
 @command_metadata('task', 'list', 'List tasks for a project with optional filters',
-                  usage='jira task list --project KEY [--assignee USER] [--status STATUS] [--labels LABEL1 LABEL2]')
+                  usage='jira task list --project KEY [--assignee USER] [--status STATUS] [--labels LABEL1 LABEL2]',
+                  options=[
+                      ('--project', {'required': True, 'help': 'Project key (required)'}),
+                      ('--assignee', {'help': 'Assignee (optional)'}),
+                      ('--status', {'help': 'Status (optional). Common values might include: To Do, In Progress, Done. Use exact status name from your Jira project.'}),
+                      ('--labels', {'nargs': '+', 'help': 'Labels (optional)'}),
+                      ('--sprint', {'help': 'Sprint (optional)'}),
+                  ])
 def handle_jira_task_list(args):
     """
     Handle the 'jira task list' command.
@@ -234,7 +301,7 @@ def handle_jira_task_list(args):
         args (argparse.Namespace): Parsed command-line arguments
     """
     try:
-        jira_manager = JiraManager()
+        jira_manager = _jira(args)
         tasks = jira_manager.get_tasks(
             project_key=args.project,
             assignee=args.assignee,
@@ -247,18 +314,98 @@ def handle_jira_task_list(args):
             print("No tasks found matching the specified criteria.")
             return
 
-        print(f"Tasks for Project {args.project}:")
+        parts = [f"Tasks for Project {args.project}:\n"]
         for task in tasks:
-            print(f"- {task['key']}: {task['summary']}")
-            print(f"  Status: {task['status']}")
-            print(f"  Assignee: {task['assignee']}")
-            if task['labels']:
-                print(f"  Labels: {', '.join(task['labels'])}")
-            print()
+            parts.append(f"- {task.key}: {task.summary}\n"
+                         f"  Status: {task.status}\n"
+                         f"  Assignee: {task.assignee}\n")
+            if task.labels:
+                parts.append(f"  Labels: {', '.join(task.labels)}\n")
+            parts.append("\n")
+        sys.stdout.write("".join(parts))
     except Exception as e:
-        logger.error(f"Error listing tasks: {e}")
+        logger.error("Error listing tasks: %s", e)
         print("Failed to list tasks. Please check the logs for more details.")
 
+@command_metadata('task', 'bulk-create', 'Create Jira tasks from JSON lines on stdin',
+                  usage='jira task bulk-create --project PROJ < tasks.jsonl',
+                  options=[
+                      ('--project', {'help': 'Project key for lines without a "project" field (optional)'}),
+                      ('--type', {'default': 'Task', 'choices': TASK_TYPES,
+                                  'help': 'Task type for lines without a "type" field (optional, default: Task)'}),
+                  ])
+def handle_jira_task_bulk_create(args):
+    """
+    Handle the 'jira task bulk-create' command.
+
+    Each stdin line is a JSON object with "summary" and optionally
+    "project", "description" and "type". Every line is validated before
+    anything is created; tasks are then created in parallel on
+    ``jira_async_workers`` threads.
+
+    Args:
+        args (argparse.Namespace): Parsed command-line arguments
+    """
+    import orjson
+    from concurrent.futures import ThreadPoolExecutor, as_completed
+    from jira_client import JiraException
+
+    rows = []
+    for line_number, line in enumerate(sys.stdin, 1):
+        if not line.strip():
+            continue
+        try:
+            row = orjson.loads(line)
+        except orjson.JSONDecodeError as e:
+            print(f"Line {line_number}: invalid JSON ({e})")
+            return
+        if not isinstance(row, dict) or not row.get('summary') or not (row.get('project') or args.project):
+            print(f"Line {line_number}: a summary and a project (or --project) are required")
+            return
+        if not all(isinstance(row.get(field, ''), str) for field in ('summary', 'project', 'description', 'type')):
+            print(f"Line {line_number}: summary, project, description and type must be strings")
+            return
+        if row.get('type') and row['type'] not in TASK_TYPES:
+            print(f"Line {line_number}: invalid type {row['type']!r} (choose from {', '.join(TASK_TYPES)})")
+            return
+        rows.append(row)
+
+    if not rows:
+        print("No tasks to create.")
+        return
+
+    try:
+        jira_manager = _jira(args)
+        # Connect before the workers start so they share one client and a
+        # connection failure is reported once
+        jira_manager.client
+    except JiraException as e:
+        logger.error("Error creating tasks: %s", e)
+        print("Failed to create tasks. Please check the logs for more details.")
+        return
+
+    created = 0
+    with ThreadPoolExecutor(max_workers=jira_manager.async_workers) as executor:
+        futures = {
+            executor.submit(
+                jira_manager.create_task,
+                project_key=row.get('project') or args.project,
+                summary=row['summary'],
+                description=row.get('description'),
+                task_type=row.get('type') or args.type
+            ): row
+            for row in rows
+        }
+        for future in as_completed(futures):
+            task = future.result()
+            if task:
+                created += 1
+                sys.stdout.write(f"- {task['key']}: {task['summary']}\n")
+            else:
+                sys.stdout.write(f"- Failed: {futures[future]['summary']}\n")
+
+    print(f"Created {created} of {len(rows)} tasks.")
+
 def handle_help(args):
     """
     Display help information for the CLI.
@@ -268,138 +415,128 @@ def handle_help(args):
     """
     display_help_summary()
 
-def setup_cli_parser():
+def _build_command(subparsers, handler):
     """
-    Set up the CLI argument parser.
+    Attach a registered command and its options to a group's subparsers.
+
+    Args:
+        subparsers: The group's argparse subparsers action
+        handler (function): Command handler registered in COMMANDS
+    """
+    command = handler.metadata
+    parser = subparsers.add_parser(
+        command.name,
+        help=command.description,
+        description=command.description,
+        epilog=f"Example: ./main.py {command.usage}" if command.usage else None
+    )
+    for flag, kwargs in command.options + COMMON_OPTIONS:
+        parser.add_argument(flag, **kwargs)
+    parser.set_defaults(func=handler)
+
+def command_path(argv):
+    """
+    Peek at the leading positional arguments to find the selected command.
+
+    Args:
+        argv (list): Command-line arguments, excluding the program name
 
     Returns:
-        argparse.ArgumentParser: Configured argument parser
+        tuple: Up to three leading non-option arguments, e.g. ('jira', 'project', 'list')
     """
-    # Create the top-level parser
-    parser = argparse.ArgumentParser(description='Jira CLI Tool', add_help=False)
-    subparsers = parser.add_subparsers(help='Commands', dest='command')
+    path = []
+    for arg in argv[:3]:
+        if arg.startswith('-'):
+            break
+        path.append(arg)
+    return tuple(path)
+
+def option_takes_value(path, arg):
+    """
+    Tell whether a command-line argument is an option that consumes the next one.
 
-    # Add custom help handling
-    parser.add_argument('command', nargs='?', default=None, help='Command to execute')
-    parser.add_argument('subcommand', nargs='?', default=None, help='Subcommand to execute')
-    parser.add_argument('action', nargs='?', default=None, help='Action to perform')
-    parser.add_argument('-h', '--help', action='store_true', help='Show help')
+    Args:
+        path (tuple): Selected command path, as returned by command_path()
+        arg (str): The argument to check, e.g. '--summary'
 
-    # Help command (default)
-    parser.set_defaults(func=handle_help)
+    Returns:
+        bool: True for a registered option of the command (or a common
+              option) that is not a store_true/store_false flag
+    """
+    if not arg.startswith('-') or '=' in arg:
+        return False
+    handler = COMMANDS.get(tuple(path[1:3]))
+    options = (handler.metadata.options if handler else ()) + COMMON_OPTIONS
+    return any(flag == arg and kwargs.get('action') not in ('store_true', 'store_false')
+               for flag, kwargs in options)
+
+def setup_cli_parser(argv=None):
+    """
+    Set up the CLI argument parser.
 
-    # Jira group
-    jira_parser = subparsers.add_parser('jira', help='Jira-related commands', add_help=False)
-    jira_subparsers = jira_parser.add_subparsers(help='Jira subcommands', dest='jira_command')
-    jira_parser.add_argument('-h', '--help', action='store_true', help='Show Jira command help')
-    jira_parser.set_defaults(func=handle_help)
+    Only the command selected in ``argv`` gets its arguments attached; every
+    other registered command is added as a bare stub so argparse still
+    reports "invalid choice" with the full list of valid names.
 
-    # Jira project subcommands
-    jira_project_parser = jira_subparsers.add_parser('project', help='Jira project commands', add_help=False)
-    jira_project_subparsers = jira_project_parser.add_subparsers(help='Jira project subcommands', dest='project_command')
-    jira_project_parser.add_argument('-h', '--help', action='store_true', help='Show Jira project command help')
-    jira_project_parser.set_defaults(func=handle_help)
-
-    # Jira project list
-    jira_project_list_parser = jira_project_subparsers.add_parser(
-        'list',
-        help='List all Jira projects',
-        description='Retrieve and display a list of all Jira projects in your workspace.',
-        epilog='Example: ./main.py jira project list'
-    )
-    jira_project_list_parser.set_defaults(func=handle_jira_project_list)
-
-    # Jira project create
-    jira_project_create_parser = jira_project_subparsers.add_parser(
-        'create',
-        help='Create a new Jira project',
-        description='Create a new Jira project with specified details.',
-        epilog='Example: ./main.py jira project create --name "My Project" --key MYPROJ'
-    )
-    jira_project_create_parser.add_argument('--name', required=True, help='Project name (required)')
-    jira_project_create_parser.add_argument('--key', required=True, help='Project key (required, must be unique)')
-    jira_project_create_parser.add_argument('--type', default='software', choices=['software', 'service'],
-                                            help='Project type (optional, default: software)')
-    jira_project_create_parser.set_defaults(func=handle_jira_project_create)
-
-    # Jira project statuses
-    jira_project_statuses_parser = jira_project_subparsers.add_parser(
-        'statuses',
-        help='List available statuses for a Jira project',
-        description='List available statuses for a Jira project.',
-        epilog='Example: ./main.py jira project statuses [--project PROJECT_KEY]'
-    )
-    jira_project_statuses_parser.add_argument('--project', help='Project key (optional)')
-    jira_project_statuses_parser.set_defaults(func=handle_jira_project_statuses)
-
-    # Jira task subcommands
-    jira_task_parser = jira_subparsers.add_parser('task', help='Jira task commands', add_help=False)
-    jira_task_subparsers = jira_task_parser.add_subparsers(help='Jira task subcommands', dest='task_command')
-    jira_task_parser.add_argument('-h', '--help', action='store_true', help='Show Jira task command help')
-    jira_task_parser.set_defaults(func=handle_help)
-
-    # Jira task create
-    jira_task_create_parser = jira_task_subparsers.add_parser(
-        'create',
-        help='Create a new Jira task',
-        description='Create a new task in a specified Jira project.',
-        epilog='Example: ./main.py jira task create --project MYPROJ --summary "Implement feature"'
-    )
-    jira_task_create_parser.add_argument('--project', required=True, help='Project key (required)')
-    jira_task_create_parser.add_argument('--summary', required=True, help='Task summary (required)')
-    jira_task_create_parser.add_argument('--description', help='Task description (optional)')
-    jira_task_create_parser.add_argument('--type', default='Task',
-                                         choices=['Task', 'Sub-task', 'Epic'],
-                                         help='Task type (optional, default: Task)')
-    jira_task_create_parser.set_defaults(func=handle_jira_task_create)
-
-    # Jira task list
-    jira_task_list_parser = jira_task_subparsers.add_parser(
-        'list',
-        help='List tasks for a project with optional filters',
-        description='List tasks for a project with optional filters.',
-        epilog='Example: ./main.py jira task list --project MYPROJ'
-    )
-    jira_task_list_parser.add_argument('--project', required=True, help='Project key (required)')
-    jira_task_list_parser.add_argument('--assignee', help='Assignee (optional)')
-    jira_task_list_parser.add_argument('--status', help='Status (optional). Common values might include: To Do, In Progress, Done. Use exact status name from your Jira project.')
-    jira_task_list_parser.add_argument('--labels', nargs='+', help='Labels (optional)')
-    jira_task_list_parser.add_argument('--sprint', help='Sprint (optional)')
-    jira_task_list_parser.set_defaults(func=handle_jira_task_list)
+    Parsers are cached per selected command path. ``parse_args`` keeps no
+    state between calls, so a cached parser can parse any argv that selects
+    the same command.
 
-    return parser
+    Args:
+        argv (list, optional): Command-line arguments, excluding the program
+                               name. Defaults to ``sys.argv[1:]``.
 
-def main():
+    Returns:
+        argparse.ArgumentParser: Configured argument parser
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    return _build_parser(command_path(argv))
+
+def _build_jira_parsers(jira_parser, path):
+    """
+    Attach the Jira project/task groups and the selected command's arguments.
+
+    Args:
+        jira_parser (argparse.ArgumentParser): Parser for the 'jira' command
+        path (tuple): Leading positional arguments, as returned by command_path()
     """
-    Main entry point for the CLI application.
+    jira_subparsers = jira_parser.add_subparsers(help='Jira subcommands', dest='jira_command')
+    for group, group_help in JIRA_GROUPS.items():
+        group_parser = jira_subparsers.add_parser(group, help=group_help)
+        if path[1:2] == (group,):
+            group_subparsers = group_parser.add_subparsers(help=f'Jira {group} subcommands',
+                                                           dest=f'{group}_command')
+            for handler in _COMMAND_GROUPS.get(group, ()):
+                name = handler.metadata.name
+                if path[2:] == (name,):
+                    _build_command(group_subparsers, handler)
+                else:
+                    group_subparsers.add_parser(name, add_help=False)
+        group_parser.set_defaults(func=handle_help)
+
+@functools.lru_cache(maxsize=32)
+def _build_parser(path):
     """
-    # Create the parser
-    parser = setup_cli_parser()
+    Build the argument parser for a selected command path.
 
-    # Check for help scenarios before parsing
-    if len(sys.argv) > 1:
-        # Check for help in nested commands
-        if sys.argv[-1] in help_commands:
-            context = None
-            if len(sys.argv) > 2:
-                context = ' '.join(sys.argv[1:-1])
-            display_help_summary(context)
+    Args:
+        path (tuple): Leading positional arguments, as returned by command_path()
 
-    # If no arguments are provided or help is explicitly requested
-    if len(sys.argv) == 1 or \
-       (len(sys.argv) > 1 and (sys.argv[1] in ['-h', '--help', 'help'])):
-        display_help_summary()
+    Returns:
+        argparse.ArgumentParser: Configured argument parser
+    """
+    # Create the top-level parser
+    parser = argparse.ArgumentParser(description='Jira CLI Tool')
+    subparsers = parser.add_subparsers(help='Commands', dest='command')
 
-    # Parse arguments
-    args = parser.parse_args()
+    # Help command (default)
+    parser.set_defaults(func=handle_help)
 
-    # If no function is set (which happens when no subcommand is used),
-    # default to help function
-    if not hasattr(args, 'func'):
-        display_help_summary()
-    else:
-        # Call the appropriate handler
-        args.func(args)
+    # Jira group; its subtree is only built when 'jira' is the selected command
+    jira_parser = subparsers.add_parser('jira', help='Jira-related commands')
+    jira_parser.set_defaults(func=handle_help)
+    if path[:1] == ('jira',):
+        _build_jira_parsers(jira_parser, path)
 
-if __name__ == "__main__":
-    main()
+    return parser
@@ -3,16 +3,41 @@
 import os
 import sys
 import logging
-from dotenv import load_dotenv
-import google.generativeai as genai
-import configparser
+import logging.handlers
+import re
+import queue
+import atexit
+import functools
+from types import MappingProxyType
 
-# Explicitly load .env file
-# Load .env file
-load_dotenv(override=True)
+# Create a logger for the current module
+logger = logging.getLogger(__name__)
+
+# Settings that must be provided by .env, environment.conf or the process environment
+REQUIRED = ('JIRA_BASE_URL', 'JIRA_API_TOKEN', 'JIRA_USERNAME')
+
+# Settings only checked when Gemini is first used
+GEMINI_REQUIRED = ('GEMINI_API_KEY', 'GEMINI_MODEL_NAME')
+
+# Seconds a cached project list is served before being refreshed in the background
+DEFAULT_PROJECTS_TTL = 300
+
+# Worker threads the Jira client uses to fetch result pages in parallel
+DEFAULT_ASYNC_WORKERS = 5
+
+# Log file written next to the working directory
+LOG_FILE = 'jira_app.log'
 
-# Configure logging based on environment variable
-debug_level = os.getenv('DEBUG_LEVEL', 'INFO').upper()
+# Size at which jira_app.log is rotated, and how many old logs are kept
+LOG_MAX_BYTES = 10 * 1024 * 1024
+LOG_BACKUP_COUNT = 3
+
+# KEY=VALUE or KEY: VALUE lines of environment.conf. Only spaces and tabs
+# are skipped around the parts, so an empty value never reaches the next line
+_KV_RE = re.compile(r'^[ \t]*([A-Za-z_]\w*)[ \t]*[=:][ \t]*(.*?)[ \t\r]*$', re.M)
+
+# Background thread writing queued records to LOG_FILE
+_log_listener = None
 
 log_levels = {
     'DEBUG': logging.DEBUG,
@@ -22,38 +47,101 @@ log_levels = {
     'CRITICAL': logging.CRITICAL
 }
 
-# Check if handlers exist before adding
-if not logging.getLogger().hasHandlers():
-    logging.getLogger().handlers.clear()
+def _load_dotenv():
+    """
+    Load the .env file unless the process environment already provides
+    every required setting, as it does when deployed with injected env vars.
+    """
+    if not all(key in os.environ for key in REQUIRED + GEMINI_REQUIRED):
+        from dotenv import load_dotenv
 
-# Create a custom handler with the desired log level
-handler = logging.StreamHandler()
-level = os.getenv('DEBUG_LEVEL', 'INFO').upper()
-handler.setLevel(getattr(logging, level, logging.WARNING))
+        load_dotenv(override=True)
 
-# Create a formatter
-formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-handler.setFormatter(formatter)
+@functools.lru_cache(maxsize=1)
+def _load_env_once():
+    """
+    Merge the .env file and ~/.config/jira-thing/environment.conf into
+    os.environ.
 
-# Configure the root logger
-root_logger = logging.getLogger()
-root_logger.setLevel(log_levels.get(debug_level, logging.WARNING))
-if root_logger.hasHandlers():
-    root_logger.handlers = []  # Clear any existing handlers
-root_logger.addHandler(handler)
+    Runs at most once per process. Child processes inherit the merged
+    environment together with _JIRA_THING_ENV_LOADED and skip the work too.
+    """
+    if os.environ.get('_JIRA_THING_ENV_LOADED'):
+        return
 
-# Add file logging
-file_handler = logging.FileHandler('jira_app.log')
-file_handler.setLevel(log_levels.get(debug_level, logging.WARNING))
-file_handler.setFormatter(formatter)
-root_logger.addHandler(file_handler)
+    # First, load from .env file
+    _load_dotenv()
 
-# Silence third-party library loggers if needed
-logging.getLogger('urllib3').setLevel(logging.WARNING)
-logging.getLogger('google').setLevel(logging.WARNING)
+    # Then try to load from user's config file
+    config_dir = os.path.expanduser('~/.config/jira-thing')
+    config_file = os.path.join(config_dir, 'environment.conf')
 
-# Create a logger for the current module
-logger = logging.getLogger(__name__)
+    # Read config file if it exists; section headers and comments are ignored
+    if os.path.exists(config_file):
+        with open(config_file) as f:
+            text = f.read()
+
+        # Values already set by .env or the process environment take precedence
+        env = os.environ
+        for match in _KV_RE.finditer(text):
+            key, value = match.groups()
+            env.setdefault(key.upper(), value)
+
+    os.environ['_JIRA_THING_ENV_LOADED'] = '1'
+
+@functools.lru_cache(maxsize=1)
+def configure_logging():
+    """
+    Configure the root logger with console and file handlers.
+
+    Runs once per process; help output never calls it, so it does not
+    touch the .env file or open jira_app.log.
+    """
+    # Load .env and environment.conf so DEBUG_LEVEL can be set there
+    _load_env_once()
+
+    # Resolve the log level once for the root logger and both handlers
+    level = log_levels.get(os.environ.get('DEBUG_LEVEL', 'INFO').upper(), logging.WARNING)
+
+    # Leave the root logger alone if it already writes to the log file,
+    # so jira_app.log is never opened by two handlers
+    global _log_listener
+    root_logger = logging.getLogger()
+    log_file = os.path.abspath(LOG_FILE)
+    if _log_listener is not None or any(
+            isinstance(h, logging.FileHandler) and h.baseFilename == log_file
+            for h in root_logger.handlers):
+        return
+
+    # Create a custom handler with the desired log level
+    handler = logging.StreamHandler()
+    handler.setLevel(level)
+
+    # Create a formatter
+    formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    handler.setFormatter(formatter)
+
+    # Configure the root logger
+    root_logger.setLevel(level)
+    root_logger.handlers = []  # Clear any existing handlers
+    root_logger.addHandler(handler)
+
+    # Add file logging through a queue so callers never wait on disk writes;
+    # delay=True opens jira_app.log on the first record only
+    file_handler = logging.handlers.RotatingFileHandler(
+        LOG_FILE, maxBytes=LOG_MAX_BYTES, backupCount=LOG_BACKUP_COUNT, delay=True)
+    file_handler.setLevel(level)
+    file_handler.setFormatter(formatter)
+    log_queue = queue.SimpleQueue()
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    _log_listener = logging.handlers.QueueListener(log_queue, file_handler, respect_handler_level=True)
+    _log_listener.start()
+    # Drain the queue before the interpreter exits
+    atexit.register(_log_listener.stop)
+
+    # Silence third-party library loggers if needed
+    logging.getLogger('urllib3').setLevel(logging.WARNING)
+    logging.getLogger('google').setLevel(logging.WARNING)
 
 def load_environment_variables():
     """
@@ -62,57 +150,97 @@ def load_environment_variables():
     2. ~/.config/jira-thing/environment.conf configuration file
 
     Raises:
-        SystemExit: If required environment variables are missing
+        SystemExit: If required environment variables are missing or invalid
     """
-    # First, load from .env file
-    load_dotenv(override=True)
+    _load_env_once()
 
-    # Then try to load from user's config file
-    config_dir = os.path.expanduser('~/.config/jira-thing')
-    config_file = os.path.join(config_dir, 'environment.conf')
+    env = {key: os.environ.get(key) for key in REQUIRED + GEMINI_REQUIRED}
+    _check_required(env, REQUIRED)
 
-    config_parser = configparser.ConfigParser()
+    return {
+        'gemini_api_key': env['GEMINI_API_KEY'],
+        'gemini_model_name': env['GEMINI_MODEL_NAME'],
+        'jira_server': env['JIRA_BASE_URL'],
+        'jira_token': env['JIRA_API_TOKEN'],
+        'jira_username': env['JIRA_USERNAME'],
+        'jira_projects_ttl': _int_setting('JIRA_PROJECTS_TTL', DEFAULT_PROJECTS_TTL, minimum=0),
+        'jira_async_workers': _int_setting('JIRA_ASYNC_WORKERS', DEFAULT_ASYNC_WORKERS, minimum=1)
+    }
 
-    # Read config file if it exists
-    if os.path.exists(config_file):
-        config_parser.read(config_file)
+def _int_setting(key, default, minimum):
+    """
+    Read an optional integer setting, exiting with an error when it is invalid.
 
-        # Override config file values with .env values if they exist
-        for section in config_parser.sections():
-            for key, value in config_parser.items(section):
-                if not os.getenv(key.upper()):
-                    os.environ[key.upper()] = value
+    Args:
+        key (str): Environment variable name
+        default (int): Value used when the setting is unset or empty
+        minimum (int): Smallest accepted value
 
-    # Check Gemini API configuration
-    api_key = os.getenv('GEMINI_API_KEY')
-    gemini_model_name = os.getenv('GEMINI_MODEL_NAME')
+    Returns:
+        int: The setting's value
 
-    if not api_key:
-        logger.error("GEMINI_API_KEY not found in .env file or ~/.config/jira-thing/environment.conf")
+    Raises:
+        SystemExit: If the value is not an integer of at least ``minimum``
+    """
+    value = os.environ.get(key)
+    if not value:
+        return default
+    try:
+        number = int(value)
+    except ValueError:
+        number = None
+    if number is None or number < minimum:
+        logger.error("Invalid %s=%r in .env file or ~/.config/jira-thing/environment.conf: "
+                     "expected an integer of at least %d", key, value, minimum)
         sys.exit(1)
+    return number
+
+def _check_required(env, keys):
+    """
+    Exit with one error listing every missing setting.
 
-    if not gemini_model_name:
-        logger.error("GEMINI_MODEL_NAME not found in .env file or ~/.config/jira-thing/environment.conf")
+    Args:
+        env (Mapping): Loaded settings keyed by environment variable name
+        keys (tuple): Names of the settings that must be set
+
+    Raises:
+        SystemExit: If any of the settings are missing
+    """
+    missing = [key for key in keys if not env.get(key)]
+    if missing:
+        logger.error("Missing %s in .env file or ~/.config/jira-thing/environment.conf", ", ".join(missing))
         sys.exit(1)
 
-    # Configure Gemini API
-    genai.configure(api_key=api_key)
+@functools.lru_cache(maxsize=1)
+def get_config():
+    """
+    Return the application configuration, loading it on first use.
 
-    # Check Jira configuration
-    jira_server = os.getenv('JIRA_BASE_URL')
-    jira_token = os.getenv('JIRA_API_TOKEN')
-    jira_username = os.getenv('JIRA_USERNAME')
+    The result is shared by every caller, so it is returned read-only.
 
-    if not all([jira_server, jira_token, jira_username]):
-        logger.error("Missing Jira connection parameters in .env file or ~/.config/jira-thing/environment.conf")
-        raise ValueError("Missing Jira connection parameters in .env file or configuration file")
+    Returns:
+        MappingProxyType: Gemini and Jira connection parameters and cache settings
+    """
+    return MappingProxyType(load_environment_variables())
 
-    return {
-        'gemini_model_name': gemini_model_name,
-        'jira_server': jira_server,
-        'jira_token': jira_token,
-        'jira_username': jira_username
-    }
+@functools.lru_cache(maxsize=1)
+def get_genai():
+    """
+    Import and configure the Gemini SDK on first use.
+
+    The import pulls in grpc and protobuf, so it is kept off every code
+    path that does not talk to Gemini.
+
+    Returns:
+        module: The configured google.generativeai module
+
+    Raises:
+        SystemExit: If the Gemini settings are missing
+    """
+    config = get_config()
+    _check_required({'GEMINI_API_KEY': config['gemini_api_key'],
+                     'GEMINI_MODEL_NAME': config['gemini_model_name']}, GEMINI_REQUIRED)
 
-# Load environment variables when this module is imported
-config = load_environment_variables()
+    import google.generativeai as genai
+    genai.configure(api_key=config['gemini_api_key'])
+    return genai
@@ -1,59 +1,391 @@
 #!/usr/bin/env python3
 
+import os
+import re
+import sys
+import time
+import atexit
+import hashlib
+import functools
 import logging
-from jira import JIRA
-from config import config
+import threading
+import itertools
+from typing import NamedTuple
+from concurrent.futures import ThreadPoolExecutor
+import orjson
+from config import get_config
 
 # Use the root logger instead of creating a new named logger
 logger = logging.getLogger()
 
+# Seconds a verified current user is trusted before Jira is asked again
+WHOAMI_TTL = 24 * 60 * 60
+
+# Jira's error for a status name the project does not have
+_STATUS_ERROR_RE = re.compile(r"does not exist for the field 'status'")
+
+# Longest an exiting process waits for a stale project cache refresh
+REFRESH_EXIT_TIMEOUT = 5
+
+# Seconds fetched statuses are reused by get_statuses()
+STATUSES_TTL = 600
+
+# Issues requested per search page, and the most get_tasks() returns
+SEARCH_PAGE_SIZE = 100
+MAX_TASKS = 1000
+
+# Issue fields get_tasks() requests unless told otherwise; description is
+# left out as it is often the largest field and the CLI does not show it
+TASK_FIELDS = ('summary', 'status', 'assignee', 'project', 'labels')
+
+def _cache_path(name):
+    """Return the path of an on-disk cache file."""
+    cache_dir = os.environ.get('XDG_CACHE_HOME') or os.path.expanduser('~/.cache')
+    return os.path.join(cache_dir, 'jira-thing', name)
+
+def _projects_cache_path():
+    """Return the path of the on-disk project list cache."""
+    return _cache_path('projects.json')
+
+def _read_cache_file(path):
+    """
+    Read a JSON cache file.
+
+    Args:
+        path (str): Cache file path
+
+    Returns:
+        tuple: (decoded data, age in seconds), or None if it cannot be read
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = orjson.loads(f.read())
+        return data, time.time() - os.path.getmtime(path)
+    except (OSError, orjson.JSONDecodeError):
+        return None
+
+def _write_cache_file(path, data):
+    """
+    Atomically write a JSON cache file, logging a warning on failure.
+
+    Args:
+        path (str): Cache file path
+        data (dict): Data to store
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            f.write(orjson.dumps(data))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.warning("Could not write cache %s: %s", path, e)
+
+def _jql_quote(value):
+    """Quote a value as a JQL string literal."""
+    return "'" + str(value).replace('\\', '\\\\').replace("'", "\\'") + "'"
+
+@functools.lru_cache(maxsize=128)
+def _build_jql(project_key=None, assignee=None, labels=(), sprint=None, status=None):
+    """
+    Build the JQL query for a set of get_tasks() filters.
+
+    Values are quoted and escaped, and conditions are always emitted in the
+    same order, so equal filters give byte-identical JQL.
+
+    Args:
+        project_key (str, optional): Project key
+        assignee (str, optional): Assignee username
+        labels (tuple, optional): Labels, sorted
+        sprint (str, optional): Sprint name or ID
+        status (str, optional): Status name
+
+    Returns:
+        str: JQL query, empty when no filter is given
+    """
+    conditions = []
+    if project_key:
+        conditions.append(f"project = {_jql_quote(project_key)}")
+    if assignee:
+        conditions.append(f"assignee = {_jql_quote(assignee)}")
+    conditions.extend(f"labels = {_jql_quote(label)}" for label in labels)
+    if sprint:
+        conditions.append(f"sprint = {_jql_quote(sprint)}")
+    if status:
+        conditions.append(f"status = {_jql_quote(status)}")
+    return " AND ".join(conditions)
+
+class Task(NamedTuple):
+    """A Jira issue as returned by JiraManager.get_tasks()."""
+    key: str
+    summary: str
+    description: str | None
+    status: str
+    assignee: str
+    project: str
+    labels: list
+
+def _task_from_json(issue):
+    """
+    Build a Task from an issue's search result JSON.
+
+    Args:
+        issue (dict): Issue object from a Jira search response
+
+    Returns:
+        Task: Task details
+    """
+    fields = issue['fields']
+    assignee = fields.get('assignee')
+    return Task(
+        issue['key'],
+        fields['summary'],
+        fields.get('description'),
+        fields['status']['name'],
+        assignee['displayName'] if assignee else 'Unassigned',
+        fields['project']['key'],
+        fields.get('labels', [])
+    )
+
+class JiraException(RuntimeError):
+    """Raised when a Jira request cannot be completed."""
+
 class JiraManager:
-    def __init__(self):
+    def __init__(self, use_cache=True):
+        """
+        Initialize the Jira manager using environment variables.
+
+        No request is made here: the client connects on first use, so a
+        command answered from the disk cache never touches the network.
+
+        Args:
+            use_cache (bool, optional): Serve the current user and project list
+                                        from the disk cache when fresh. When
+                                        False, both are fetched from Jira and
+                                        the caches refreshed. Defaults to True.
+        """
+        # Read the connection settings once; later calls use these attributes
+        config = get_config()
+        self.server = config['jira_server']
+        self.username = config['jira_username']
+        self.projects_ttl = config['jira_projects_ttl']
+        self.use_cache = use_cache
+        # Thread pools need at least one worker
+        self.async_workers = max(1, config['jira_async_workers'])
+        # In-process copy of the project list and its time.monotonic() expiry
+        self._projects = None
+        self._projects_expiry = 0.0
+        # Thread refreshing a stale project cache, if one was started
+        self._projects_refresh = None
+        # Statuses keyed by project key (None for global), as (expiry, statuses)
+        self._status_cache = {}
+
+    @functools.cached_property
+    def client(self):
         """
-        Initialize the Jira client using environment variables.
+        The Jira client, connected on first access.
 
         Raises:
-            RuntimeError: If Jira connection cannot be established
+            JiraException: If Jira connection cannot be established
         """
+        # The jira library and its dependencies take a noticeable share of
+        # startup, and commands answered from the disk cache never need them
+        from jira import JIRA
+        from requests.adapters import HTTPAdapter, DEFAULT_POOLSIZE
+
         try:
-            # Initialize Jira client
-            self.client = JIRA(
-                server=config['jira_server'],
-                basic_auth=(config['jira_username'], config['jira_token'])
+            # Initialize Jira client. Result pages are fetched on the manager's
+            # own threads, so the library's async mode is not used
+            client = JIRA(
+                server=self.server,
+                basic_auth=(self.username, get_config()['jira_token'])
             )
 
-            # Verify connection by getting current user
-            self.client.current_user = self.client.current_user()
+            # All calls share the client's keep-alive session; grow its pool when
+            # more workers than the default pool size would otherwise open and
+            # discard extra connections. Retries stay with ResilientSession.
+            if self.async_workers > DEFAULT_POOLSIZE:
+                adapter = HTTPAdapter(pool_maxsize=self.async_workers)
+                client._session.mount('https://', adapter)
+                client._session.mount('http://', adapter)
 
-            logger.info(f"Successfully connected to Jira at {config['jira_server']}")
+            logger.info("Successfully connected to Jira at %s", self.server)
         except Exception as e:
-            logger.critical(f"Failed to initialize Jira client: {e}", exc_info=True)
-            raise RuntimeError(f"Jira client initialization failed: {e}")
+            # Failures here are reported to the user anyway; the traceback is
+            # only formatted when debugging
+            logger.critical("Failed to initialize Jira client: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+            raise JiraException(f"Jira client initialization failed: {e}")
+        return client
+
+    @functools.cached_property
+    def _current_user(self):
+        """
+        The signed-in user, reused from the disk cache when the same
+        credentials were verified within WHOAMI_TTL.
+
+        Raises:
+            JiraException: If Jira connection cannot be established
+        """
+        credentials = hashlib.sha256(
+            f"{self.server}\0{self.username}\0{get_config()['jira_token']}".encode()).hexdigest()
+        current_user = self._read_whoami_cache(credentials) if self.use_cache else None
+        if current_user is None:
+            current_user = self.client.current_user()
+            _write_cache_file(_cache_path('whoami.json'),
+                              {'credentials': credentials, 'current_user': current_user})
+        return current_user
+
+    def close(self):
+        """
+        Close the Jira client's HTTP session and its pooled connections.
+        """
+        # Nothing to close if the client was never connected
+        if 'client' in self.__dict__:
+            self.client.close()
 
     def get_projects(self):
         """
         Retrieve a list of available Jira projects.
 
+        Results are cached on disk for ``jira_projects_ttl`` seconds and kept
+        in memory for the life of the manager. Once the cache is stale it is
+        still returned immediately, while a background thread fetches a fresh
+        copy for the next call; the process waits up to REFRESH_EXIT_TIMEOUT
+        seconds for it before exiting.
+
         Returns:
             list: A list of project dictionaries containing project details.
+
+        Raises:
+            JiraException: If the projects cannot be retrieved
+        """
+        if self._projects is not None and time.monotonic() < self._projects_expiry:
+            return self._projects
+
+        cached = self._read_projects_cache() if self.use_cache else None
+        if cached is None:
+            return self._fetch_projects()
+
+        project_list, age = cached
+        if age >= self.projects_ttl:
+            # Serve the stale copy from memory until the refresh replaces it
+            age = 0
+            # A one-shot command gives the refresh up to REFRESH_EXIT_TIMEOUT
+            # seconds at exit to leave a fresh cache for the next run; a hung
+            # Jira cannot keep the process alive past that
+            self._projects_refresh = threading.Thread(target=self._refresh_projects_cache, daemon=True)
+            self._projects_refresh.start()
+            atexit.register(self._projects_refresh.join, REFRESH_EXIT_TIMEOUT)
+        self._remember_projects(project_list, self.projects_ttl - age)
+        return project_list
+
+    def _remember_projects(self, project_list, ttl):
+        """Keep the project list in memory for ``ttl`` seconds."""
+        self._projects = project_list
+        self._projects_expiry = time.monotonic() + ttl
+
+    def _fetch_projects(self):
+        """
+        Fetch the project list from Jira and store it in the disk cache.
+
+        Returns:
+            list: A list of project dictionaries containing project details.
+
+        Raises:
+            JiraException: If the projects cannot be retrieved
         """
         try:
-            # Retrieve projects
-            projects = self.client.projects()
+            # Read the raw project JSON rather than client.projects(), which
+            # builds a Resource object per project only for us to drop all but
+            # three fields; the session raises JIRAError on error responses
+            response = self.client._session.get(self.client._get_url('project'))
             project_list = [
                 {
-                    'key': project.key,
-                    'name': project.name
+                    'key': project['key'],
+                    'name': project['name'],
+                    'id': project['id']
                 }
-                for project in projects
+                for project in orjson.loads(response.content)
             ]
 
-            logger.debug(f"Successfully retrieved {len(project_list)} Jira projects. Project keys: {[p['key'] for p in project_list]}")
-            return project_list
-
+            # The key list is a second pass over the projects, only worth it when debugging
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Successfully retrieved %d Jira projects. Project keys: %s",
+                             len(project_list), [p['key'] for p in project_list])
         except Exception as e:
-            logger.error(f"Failed to retrieve Jira projects: {e}", exc_info=True)
-            raise
+            logger.error("Failed to retrieve Jira projects: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
+            raise JiraException(f"Failed to retrieve Jira projects: {e}") from e
+
+        self._write_projects_cache(project_list)
+        self._remember_projects(project_list, self.projects_ttl)
+        return project_list
+
+    def _refresh_projects_cache(self):
+        """Refresh a stale project cache; failures keep the stale copy."""
+        try:
+            self._fetch_projects()
+        except JiraException:
+            pass  # Already logged by _fetch_projects
+
+    def _read_whoami_cache(self, credentials):
+        """
+        Read the cached current user for a set of credentials.
+
+        Args:
+            credentials (str): Hash of the server, username and API token
+
+        Returns:
+            str: The cached current user, or None on a miss or after WHOAMI_TTL
+        """
+        cached = _read_cache_file(_cache_path('whoami.json'))
+        if cached is None:
+            return None
+
+        data, age = cached
+        if age >= WHOAMI_TTL or data.get('credentials') != credentials:
+            return None
+        return data.get('current_user')
+
+    def _read_projects_cache(self):
+        """
+        Read the cached project list for this server and user.
+
+        Returns:
+            tuple: (project list, age in seconds), or None on a cache miss
+        """
+        cached = _read_cache_file(_projects_cache_path())
+        if cached is None:
+            return None
+
+        data, age = cached
+        if data.get('server') != self.server or data.get('username') != self.username:
+            return None
+        return data['projects'], age
+
+    def _write_projects_cache(self, project_list):
+        """
+        Atomically write the project list to the disk cache.
+
+        Args:
+            project_list (list): Project dictionaries to cache
+        """
+        _write_cache_file(_projects_cache_path(),
+                          {'server': self.server, 'username': self.username, 'projects': project_list})
+
+    def refresh_projects(self):
+        """
+        Drop the cached project list, in memory and on disk, so the next
+        get_projects() call fetches it from Jira.
+
+        Call this after changing projects outside of create_project().
+        """
+        self._projects = None
+        try:
+            os.remove(_projects_cache_path())
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning("Could not remove project cache: %s", e)
 
     def create_project(self, name, key, project_type='software'):
         """
@@ -68,21 +400,20 @@ class JiraManager:
             dict: Created project details or None if creation fails
         """
         try:
-            project_dict = {
-                'key': key,
-                'name': name,
-                'projectTypeKey': project_type
-            }
-
-            new_project = self.client.create_project(**project_dict)
-            logger.info(f"Successfully created project: {name} ({key})")
+            # Passing the lead saves the library a GET /myself
+            new_project = self.client.create_project(key=key, name=name, assignee=self._current_user,
+                                                     ptype=project_type)
+            self.refresh_projects()
+            logger.info("Successfully created project: %s (%s)", name, key)
+            # The library returns the response JSON, which has the key and id
+            # but not the name
             return {
-                'key': new_project.key,
-                'name': new_project.name,
-                'id': new_project.id
+                'key': new_project['key'],
+                'name': name,
+                'id': new_project['id']
             }
         except Exception as e:
-            logger.error(f"Failed to create project {name}: {e}", exc_info=True)
+            logger.error("Failed to create project %s: %s", name, e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
 
     def create_task(self, project_key, summary, description=None, task_type='Task'):
@@ -99,25 +430,30 @@ class JiraManager:
             dict: Created task details or None if creation fails
         """
         try:
-            task_dict = {
-                'project': project_key,
-                'summary': summary,
-                'description': description or '',
-                'issuetype': {'name': task_type}
-            }
-
-            new_task = self.client.create_issue(**task_dict)
-            logger.info(f"Successfully created task: {summary} in project {project_key}")
+            # A {'key': ...} project and {'name': ...} issue type are sent as-is;
+            # bare strings make the library look each one up first. Without
+            # prefetch the created issue is not fetched back, so the summary
+            # and project are reported from what was sent.
+            new_task = self.client.create_issue(
+                fields={
+                    'project': {'key': project_key},
+                    'summary': summary,
+                    'description': description or '',
+                    'issuetype': {'name': task_type}
+                },
+                prefetch=False
+            )
+            logger.info("Successfully created task: %s in project %s", summary, project_key)
             return {
                 'key': new_task.key,
-                'summary': new_task.fields.summary,
-                'project': new_task.fields.project.key
+                'summary': summary,
+                'project': project_key
             }
         except Exception as e:
-            logger.error(f"Failed to create task {summary}: {e}", exc_info=True)
+            logger.error("Failed to create task %s: %s", summary, e, exc_info=logger.isEnabledFor(logging.DEBUG))
             return None
 
-    def get_tasks(self, project_key=None, assignee=None, labels=None, sprint=None, status=None):
+    def get_tasks(self, project_key=None, assignee=None, labels=None, sprint=None, status=None, fields=None):
         """
         Retrieve Jira tasks with optional filtering.
 
@@ -127,81 +463,159 @@ class JiraManager:
             labels (list, optional): Filter tasks by labels
             sprint (str, optional): Filter tasks by sprint name or ID
             status (str, optional): Filter tasks by status (e.g., 'To Do', 'In Progress', 'Done')
+            fields (list, optional): Issue fields to request. Defaults to
+                                     TASK_FIELDS; add 'description' to get it.
 
         Returns:
-            list: A list of task dictionaries containing task details
+            list: A list of Task tuples
         """
         try:
-            # If no specific filters, get all statuses for the project to help diagnose
-            if project_key and not any([assignee, labels, sprint, status]):
-                # Get all issues for the project to capture all statuses
-                all_issues = self.client.search_issues(f"project = '{project_key}'",
-                                                       fields=['status'],
-                                                       maxResults=1000)
-                if all_issues:
-                    # Collect unique statuses
-                    unique_statuses = set(issue.fields.status.name for issue in all_issues)
-
-                    print("Statuses in these issues:")
-                    for unique_status in sorted(unique_statuses):
-                        print(f"- {unique_status}")
-
-            # Construct JQL query dynamically
-            jql_conditions = []
-            if project_key:
-                jql_conditions.append(f"project = '{project_key}'")
-            if assignee:
-                jql_conditions.append(f"assignee = '{assignee}'")
-            if labels:
-                jql_conditions.extend([f"labels = '{label}'" for label in labels])
-            if sprint:
-                jql_conditions.append(f"sprint = '{sprint}'")
-            if status:
-                jql_conditions.append(f"status = '{status}'")
-
-            # Combine conditions
-            jql_query = " AND ".join(jql_conditions) if jql_conditions else ""
-
-            # Search for issues
-            issues = self.client.search_issues(jql_query, maxResults=1000,
-                                               fields=['summary', 'description', 'status', 'assignee', 'project', 'labels'])
-
-            task_list = [
-                {
-                    'key': issue.key,
-                    'summary': issue.fields.summary,
-                    'description': issue.fields.description,
-                    'status': issue.fields.status.name,
-                    'assignee': issue.fields.assignee.displayName if issue.fields.assignee else 'Unassigned',
-                    'project': issue.fields.project.key,
-                    'labels': issue.fields.labels
-                }
-                for issue in issues
-            ]
-
-            logger.debug(f"Successfully retrieved {len(task_list)} Jira tasks.")
+            if project_key or assignee or labels or sprint or status:
+                jql_query = _build_jql(project_key, assignee, tuple(sorted(labels or ())), sprint, status)
+            else:
+                # Unfiltered listing: no labels to sort and no query to build
+                jql_query = ''
+            task_list = self._fetch_tasks(jql_query, fields or TASK_FIELDS)
+
+            logger.debug("Successfully retrieved %d Jira tasks.", len(task_list))
             return task_list
 
         except Exception as e:
-            # Add more detailed error logging
-            logger.error(f"Failed to retrieve Jira tasks: {e}", exc_info=True)
-
-            # If it's a status-related error, try to get available statuses
-            if "does not exist for the field 'status'" in str(e):
+            # A mistyped status is a user error: no traceback, list the valid ones
+            if _STATUS_ERROR_RE.search(str(e)):
+                logger.warning("Failed to retrieve Jira tasks: %s", e)
                 try:
-                    # Fetch all statuses for the project
-                    project_statuses = self.client.project(project_key).statuses
-                    print("Valid statuses for this project:")
-                    for status_obj in project_statuses:
-                        print(status_obj.name)
+                    # Statuses are cached, so this is usually free; names repeat
+                    # across issue types
+                    project_statuses = dict.fromkeys(status['name'] for status in self.get_statuses(project_key))
+                    sys.stdout.write("Valid statuses for this project:\n" + "".join(
+                        f"{status_name}\n" for status_name in project_statuses))
                 except Exception as status_error:
-                    logger.error(f"Could not retrieve project statuses: {status_error}")
+                    logger.error("Could not retrieve project statuses: %s", status_error)
+            else:
+                logger.error("Failed to retrieve Jira tasks: %s", e, exc_info=logger.isEnabledFor(logging.DEBUG))
             raise
 
+    def get_tasks_bulk(self, queries, fields=None):
+        """
+        Retrieve the tasks for several filter sets at once.
+
+        Queries that build the same JQL are searched once, and distinct
+        queries are searched in parallel on ``async_workers`` threads.
+
+        Args:
+            queries (list): Dicts of get_tasks() filters (project_key,
+                            assignee, labels, sprint, status)
+            fields (list, optional): Issue fields to request. Defaults to TASK_FIELDS.
+
+        Returns:
+            dict: Lists of Task tuples keyed by JQL query, in query order
+        """
+        jql_queries = list(dict.fromkeys(
+            _build_jql(query.get('project_key'), query.get('assignee'), tuple(sorted(query.get('labels') or ())),
+                       query.get('sprint'), query.get('status'))
+            for query in queries))
+        fields = fields or TASK_FIELDS
+
+        # Connect before the workers start so they share one client. Each
+        # worker pages through its query sequentially, keeping the number of
+        # concurrent requests at async_workers
+        self.client
+        with ThreadPoolExecutor(max_workers=self.async_workers) as executor:
+            task_lists = executor.map(lambda jql: self._fetch_tasks(jql, fields, parallel=False), jql_queries)
+            return dict(zip(jql_queries, task_lists))
+
+    def _fetch_tasks(self, jql, fields, parallel=True):
+        """
+        Run a JQL search and convert up to MAX_TASKS results to tasks.
+
+        Results are converted page by page so only one page of raw JSON is
+        alive at a time.
+
+        Args:
+            jql (str): JQL query
+            fields (list): Issue fields to return
+            parallel (bool, optional): Fetch Jira Server pages in parallel.
+                                       Defaults to True.
+
+        Returns:
+            list: A list of Task tuples
+        """
+        issues = self._iter_issues(jql, fields, parallel)
+        return [_task_from_json(issue) for issue in itertools.islice(issues, MAX_TASKS)]
+
+    def _iter_issues(self, jql, fields, parallel=True):
+        """
+        Yield the raw JSON of the issues matching a JQL query, in result order.
+
+        Jira Server reports the total on the first page, so the remaining
+        pages (up to MAX_TASKS issues) are requested in parallel on
+        ``async_workers`` threads unless ``parallel`` is False. Jira Cloud
+        pages with a nextPageToken, which can only be followed one page at a
+        time; it stops once the consumer stops iterating.
+
+        Args:
+            jql (str): JQL query
+            fields (list): Issue fields to return
+            parallel (bool, optional): Fetch Jira Server pages in parallel.
+                                       Defaults to True.
+
+        Yields:
+            dict: Issue JSON objects
+        """
+        fields = ','.join(fields)
+        if self.client._is_cloud:
+            token = None
+            while True:
+                page = self._search_page('search/jql', {'jql': jql, 'nextPageToken': token,
+                                                        'maxResults': SEARCH_PAGE_SIZE, 'fields': fields})
+                yield from page['issues']
+                token = page.get('nextPageToken')
+                if not token:
+                    return
+
+        def fetch_page(start):
+            return self._search_page('search', {'jql': jql, 'startAt': start,
+                                                'maxResults': SEARCH_PAGE_SIZE, 'fields': fields})
+
+        first = fetch_page(0)
+        yield from first['issues']
+        # The server may apply a smaller page size than requested
+        step = first.get('maxResults') or len(first['issues'])
+        if step:
+            starts = range(step, min(first.get('total', 0), MAX_TASKS), step)
+            if not parallel:
+                for start in starts:
+                    yield from fetch_page(start)['issues']
+                return
+            with ThreadPoolExecutor(max_workers=self.async_workers) as executor:
+                for page in executor.map(fetch_page, starts):
+                    yield from page['issues']
+
+    def _search_page(self, path, params):
+        """
+        Fetch one page of search results.
+
+        The request goes straight through the client's session: the
+        library's search_issues() decodes with the stdlib json module and
+        loads the full field list (GET /field) before its first search.
+
+        Args:
+            path (str): REST path, 'search' or 'search/jql'
+            params (dict): Query parameters; None values are left out
+
+        Returns:
+            dict: Decoded search response
+        """
+        response = self.client._session.get(self.client._get_url(path), params=params)
+        return orjson.loads(response.content)
+
     def get_statuses(self, project_key=None):
         """
         Retrieve all available statuses for a Jira project.
 
+        Results are kept in memory for STATUSES_TTL seconds per project.
+
         Args:
             project_key (str, optional): Project key to retrieve statuses for.
                                          If None, retrieves global statuses.
@@ -209,21 +623,50 @@ class JiraManager:
         Returns:
             list: A list of dictionaries containing status details grouped by issue type
         """
+        cached = self._status_cache.get(project_key)
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
+
+        statuses = self._fetch_statuses(project_key)
+        self._status_cache[project_key] = (time.monotonic() + STATUSES_TTL, statuses)
+        return statuses
+
+    def invalidate_status_cache(self, project_key=None):
+        """
+        Drop cached statuses so the next get_statuses() call fetches them again.
+
+        Args:
+            project_key (str, optional): Project whose statuses to drop.
+                                         If None, drops the global statuses.
+        """
+        self._status_cache.pop(project_key, None)
+
+    def _fetch_statuses(self, project_key):
+        """
+        Fetch statuses from Jira.
+
+        Args:
+            project_key (str): Project key, or None for global statuses
+
+        Returns:
+            list: A list of dictionaries containing status details
+        """
         try:
-            # Use the REST API directly to get global statuses
-            url = f'{self.client.server_url}/rest/api/2/status'
-            response = self.client._session.get(url)
-            response.raise_for_status()
-            statuses = response.json()
-            return [
-                {
-                    'id': status['id'],
-                    'name': status['name'],
-                    'description': status.get('description', ''),
-                    'category': status.get('statusCategory', {}).get('name', '')
-                }
-                for status in statuses
-            ]
+            if not project_key:
+                # Use the REST API directly to get global statuses
+                url = f'{self.client.server_url}/rest/api/2/status'
+                response = self.client._session.get(url)
+                response.raise_for_status()
+                statuses = orjson.loads(response.content)
+                return [
+                    {
+                        'id': status['id'],
+                        'name': status['name'],
+                        'description': status.get('description', ''),
+                        'category': status.get('statusCategory', {}).get('name', '')
+                    }
+                    for status in statuses
+                ]
 
             # Use the REST API directly to get project-specific statuses
             url = f'{self.client.server_url}/rest/api/2/project/{project_key}/statuses'
@@ -233,7 +676,7 @@ class JiraManager:
             response.raise_for_status()
 
             # Parse the JSON response
-            project_statuses = response.json()
+            project_statuses = orjson.loads(response.content)
 
             # Flatten and format the statuses
             formatted_statuses = []
@@ -248,9 +691,10 @@ class JiraManager:
                         'category': status.get('statusCategory', {}).get('name', '')
                     })
 
-            logger.warning(f"Retrieved {len(formatted_statuses)} statuses for project {project_key}")
+            logger.debug("Retrieved %d statuses for project %s", len(formatted_statuses), project_key)
             return formatted_statuses
 
         except Exception as e:
-            logger.error(f"Failed to retrieve statuses for project {project_key}: {e}", exc_info=True)
+            logger.error("Failed to retrieve statuses for project %s: %s", project_key, e,
+                         exc_info=logger.isEnabledFor(logging.DEBUG))
             raise
@@ -1,42 +1,34 @@
 #!/usr/bin/env python3
 
 import sys
-from cli import setup_cli_parser, help_commands, display_help_summary
+from cli import setup_cli_parser, command_path, option_takes_value, HELP_COMMANDS, display_help_summary, handle_help
+from config import configure_logging
 
 def main():
     """
     Main entry point for the CLI application.
     """
-    # Create the parser
-    parser = setup_cli_parser()
-
-    # If no arguments are provided or help is explicitly requested
-    if len(sys.argv) == 1 or \
-       (len(sys.argv) > 1 and (sys.argv[1] in ['-h', '--help', 'help'])):
-        display_help_summary()
+    # Help never needs argparse, so answer it before building any parser.
+    # The help table is keyed on the command path, so options given before
+    # --help (e.g. 'jira task create --project X --help') are skipped.
+    # A trailing 'help' right after an option that takes a value is that
+    # option's value (e.g. --summary help), unlike after a flag such as
+    # --no-cache; argparse never takes -h/--help as a value.
+    argv = sys.argv[1:]
+    trailing_help = argv and argv[-1] in HELP_COMMANDS and (
+        argv[-1] != 'help' or len(argv) == 1 or not option_takes_value(command_path(argv), argv[-2]))
+    if not argv or argv[0] in HELP_COMMANDS or trailing_help:
+        display_help_summary(' '.join(command_path(argv[:-1])) or None)
         sys.exit(0)
 
-    # Special handling for help in nested commands
-    if len(sys.argv) > 1 and sys.argv[1] == 'jira':
-        if len(sys.argv) > 2 and sys.argv[2] in help_commands:
-            # General Jira help
-            display_help_summary('jira')
-            sys.exit(0)
-        elif len(sys.argv) > 3 and sys.argv[3] in help_commands:
-            # Specific Jira subcommand help
-            display_help_summary(f'jira {sys.argv[2]}')
-            sys.exit(0)
-
-    # Parse arguments
-    args = parser.parse_args()
+    # Parse once and dispatch once; every parser level sets a default func,
+    # so commands without a subcommand land on handle_help
+    args = setup_cli_parser(argv).parse_args(argv)
 
-    # If no function is set (which happens when no subcommand is used),
-    # default to help function
-    if not hasattr(args, 'func'):
-        display_help_summary()
-    else:
-        # Call the appropriate handler
-        args.func(args)
+    # Help needs neither the configuration nor the log file
+    if args.func is not handle_help:
+        configure_logging()
+    args.func(args)
 
 if __name__ == '__main__':
     main()
@@ -0,0 +1,160 @@
+#!/usr/bin/env python3
+
+import io
+import pytest
+from unittest.mock import PropertyMock, patch
+import cli
+from jira_client import JiraException
+
+@pytest.fixture(autouse=True)
+def reset_jira_manager(monkeypatch):
+    monkeypatch.setattr(cli, '_jira_manager', None)
+
+def test_setup_cli_parser_builds_selected_command():
+    """Test that the selected leaf command gets its arguments attached."""
+    argv = ['jira', 'task', 'create', '--project', 'TEST1', '--summary', 'Test Task']
+    args = cli.setup_cli_parser(argv).parse_args(argv)
+
+    assert args.func is cli.handle_jira_task_create
+    assert args.project == 'TEST1'
+    assert args.summary == 'Test Task'
+    assert args.type == 'Task'
+
+def test_setup_cli_parser_skips_unselected_commands():
+    """Test that only the selected leaf command is built."""
+    argv = ['jira', 'project', 'list']
+    cli._build_parser.cache_clear()
+    with patch('cli._build_command', wraps=cli._build_command) as build_command:
+        cli.setup_cli_parser(argv)
+
+    assert [call.args[1] for call in build_command.call_args_list] == [cli.handle_jira_project_list]
+
+def test_setup_cli_parser_rejects_unknown_command(capsys):
+    """Test that unknown leaf commands still report the valid choices."""
+    argv = ['jira', 'task', 'unknown']
+    with pytest.raises(SystemExit):
+        cli.setup_cli_parser(argv).parse_args(argv)
+
+    assert "invalid choice: 'unknown' (choose from 'create', 'list', 'bulk-create')" in capsys.readouterr().err
+
+def test_handle_jira_project_list_reports_jira_errors(capsys):
+    """Test that Jira failures are reported instead of raising."""
+    with patch('jira_client.JiraManager', side_effect=JiraException("Connection failed")):
+        cli.handle_jira_project_list(None)
+
+    assert "Failed to list projects" in capsys.readouterr().out
+
+def test_display_help_summary_uses_command_registry(capsys):
+    """Test that command help is rendered from the registered metadata."""
+    cli.display_help_summary('jira project create')
+    output = capsys.readouterr().out
+
+    assert "Jira Project Create Command:" in output
+    assert "--key         Project key (required, must be unique)" in output
+
+def test_setup_cli_parser_reuses_parser_for_same_command():
+    """Test that the parser is cached per selected command."""
+    first = cli.setup_cli_parser(['jira', 'task', 'list', '--project', 'TEST1'])
+    second = cli.setup_cli_parser(['jira', 'task', 'list', '--project', 'TEST2'])
+
+    assert first is second
+    assert second.parse_args(['jira', 'task', 'list', '--project', 'TEST2']).project == 'TEST2'
+    assert cli.setup_cli_parser(['jira', 'task', 'create']) is not first
+
+def test_jira_manager_is_shared_between_handlers():
+    """Test that handlers reuse one JiraManager per process."""
+    with patch('jira_client.JiraManager') as manager_class:
+        manager_class.return_value.get_projects.return_value = []
+        cli.handle_jira_project_list(None)
+        cli.handle_jira_project_list(None)
+
+    manager_class.assert_called_once_with(use_cache=True)
+
+def test_jira_manager_is_closed_at_exit():
+    """Test that the shared manager's session is closed on shutdown."""
+    with patch('jira_client.JiraManager') as manager_class, patch('cli.atexit.register') as register:
+        cli._jira(None)
+        cli._jira(None)
+
+    register.assert_called_once_with(manager_class.return_value.close)
+
+def test_no_cache_flag_bypasses_jira_caches():
+    """Test that --no-cache is accepted by every command and reaches JiraManager."""
+    argv = ['jira', 'project', 'list', '--no-cache']
+    args = cli.setup_cli_parser(argv).parse_args(argv)
+    with patch('jira_client.JiraManager') as manager_class:
+        manager_class.return_value.get_projects.return_value = []
+        args.func(args)
+
+    manager_class.assert_called_once_with(use_cache=False)
+
+def test_handle_jira_task_bulk_create_creates_every_line(capsys, monkeypatch):
+    """Test that each stdin line becomes one task, using --project as the default."""
+    monkeypatch.setattr('sys.stdin', io.StringIO(
+        '{"summary": "First"}\n'
+        '\n'
+        '{"summary": "Second", "project": "OTHER", "type": "Epic"}\n'))
+    argv = ['jira', 'task', 'bulk-create', '--project', 'TEST1']
+    args = cli.setup_cli_parser(argv).parse_args(argv)
+    with patch('jira_client.JiraManager') as manager_class:
+        manager = manager_class.return_value
+        manager.async_workers = 2
+        manager.create_task.side_effect = lambda **task: {'key': f"{task['project_key']}-1", 'summary': task['summary']}
+        args.func(args)
+
+    calls = {call.kwargs['project_key']: call.kwargs['task_type'] for call in manager.create_task.call_args_list}
+    assert calls == {'TEST1': 'Task', 'OTHER': 'Epic'}
+    assert "Created 2 of 2 tasks." in capsys.readouterr().out
+
+def test_handle_jira_task_bulk_create_reports_connection_failure_once(capsys, monkeypatch):
+    """Test that a failed connection is reported once and nothing is submitted."""
+    monkeypatch.setattr('sys.stdin', io.StringIO('{"summary": "First"}\n{"summary": "Second"}\n'))
+    argv = ['jira', 'task', 'bulk-create', '--project', 'TEST1']
+    args = cli.setup_cli_parser(argv).parse_args(argv)
+    with patch('jira_client.JiraManager') as manager_class:
+        manager = manager_class.return_value
+        type(manager).client = PropertyMock(side_effect=JiraException("Connection failed"))
+        args.func(args)
+
+    manager.create_task.assert_not_called()
+    assert capsys.readouterr().out == "Failed to create tasks. Please check the logs for more details.\n"
+
+def test_handle_jira_task_bulk_create_rejects_invalid_lines(capsys, monkeypatch):
+    """Test that nothing is created when a line is invalid."""
+    monkeypatch.setattr('sys.stdin', io.StringIO('{"summary": "First"}\nnot json\n'))
+    argv = ['jira', 'task', 'bulk-create', '--project', 'TEST1']
+    args = cli.setup_cli_parser(argv).parse_args(argv)
+    with patch('jira_client.JiraManager') as manager_class:
+        args.func(args)
+
+    manager_class.assert_not_called()
+    assert "Line 2: invalid JSON" in capsys.readouterr().out
+
+@pytest.mark.parametrize('line, error', [
+    ('{"summary": 1}', "Line 1: summary, project, description and type must be strings"),
+    ('{"summary": "First", "type": "Story"}', "Line 1: invalid type 'Story' (choose from Task, Sub-task, Epic)"),
+])
+def test_handle_jira_task_bulk_create_rejects_invalid_fields(line, error, capsys, monkeypatch):
+    """Test that wrongly typed fields and unknown issue types fail before anything is created."""
+    monkeypatch.setattr('sys.stdin', io.StringIO(line + '\n'))
+    argv = ['jira', 'task', 'bulk-create', '--project', 'TEST1']
+    args = cli.setup_cli_parser(argv).parse_args(argv)
+    with patch('jira_client.JiraManager') as manager_class:
+        args.func(args)
+
+    manager_class.assert_not_called()
+    assert error in capsys.readouterr().out
+
+def test_handle_jira_task_list_prints_tasks(capsys):
+    """Test that tasks are listed with their status, assignee and labels."""
+    from jira_client import Task
+    argv = ['jira', 'task', 'list', '--project', 'TEST1']
+    args = cli.setup_cli_parser(argv).parse_args(argv)
+    with patch('jira_client.JiraManager') as manager_class:
+        manager_class.return_value.get_tasks.return_value = [
+            Task('TEST1-1', 'First', None, 'To Do', 'Unassigned', 'TEST1', ['backend'])
+        ]
+        args.func(args)
+
+    output = capsys.readouterr().out
+    assert "- TEST1-1: First\n  Status: To Do\n  Assignee: Unassigned\n  Labels: backend\n" in output
@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+
+import os
+import sys
+import logging
+import logging.handlers
+import pytest
+from unittest.mock import patch
+import config
+
+@pytest.fixture
+def required_env(monkeypatch):
+    values = {
+        'GEMINI_API_KEY': 'fake_gemini_key',
+        'GEMINI_MODEL_NAME': 'fake_gemini_model',
+        'JIRA_BASE_URL': 'https://test.atlassian.net',
+        'JIRA_API_TOKEN': 'test_token',
+        'JIRA_USERNAME': 'test_user'
+    }
+    for key, value in values.items():
+        monkeypatch.setenv(key, value)
+    monkeypatch.setenv('HOME', '/nonexistent')
+    monkeypatch.setenv('_JIRA_THING_ENV_LOADED', '')
+    config._load_env_once.cache_clear()
+    return values
+
+@patch('dotenv.load_dotenv')
+def test_load_environment_variables(mock_load_dotenv, required_env):
+    """Test that the configuration is built from the environment."""
+    loaded = config.load_environment_variables()
+
+    assert loaded == {
+        'gemini_api_key': 'fake_gemini_key',
+        'gemini_model_name': 'fake_gemini_model',
+        'jira_server': 'https://test.atlassian.net',
+        'jira_token': 'test_token',
+        'jira_username': 'test_user',
+        'jira_projects_ttl': 300,
+        'jira_async_workers': 5
+    }
+
+@patch('dotenv.load_dotenv')
+def test_load_environment_variables_reports_all_missing(mock_load_dotenv, required_env, monkeypatch, caplog):
+    """Test that every missing setting is reported in one error."""
+    monkeypatch.delenv('JIRA_API_TOKEN')
+    monkeypatch.delenv('JIRA_USERNAME')
+
+    with caplog.at_level(logging.ERROR), pytest.raises(SystemExit):
+        config.load_environment_variables()
+
+    assert "Missing JIRA_API_TOKEN, JIRA_USERNAME" in caplog.text
+
+@patch('dotenv.load_dotenv')
+def test_load_environment_variables_defaults_empty_worker_count(mock_load_dotenv, required_env, monkeypatch):
+    """Test that an empty JIRA_ASYNC_WORKERS falls back to the default."""
+    monkeypatch.setenv('JIRA_ASYNC_WORKERS', '')
+
+    assert config.load_environment_variables()['jira_async_workers'] == config.DEFAULT_ASYNC_WORKERS
+
+@pytest.mark.parametrize('value', ['abc', '0', '-2'])
+@patch('dotenv.load_dotenv')
+def test_load_environment_variables_rejects_invalid_worker_count(mock_load_dotenv, value, required_env,
+                                                                 monkeypatch, caplog):
+    """Test that a non-integer or non-positive JIRA_ASYNC_WORKERS exits with an error."""
+    monkeypatch.setenv('JIRA_ASYNC_WORKERS', value)
+
+    with caplog.at_level(logging.ERROR), pytest.raises(SystemExit):
+        config.load_environment_variables()
+
+    assert f"Invalid JIRA_ASYNC_WORKERS='{value}'" in caplog.text
+
+@patch('dotenv.load_dotenv')
+def test_gemini_settings_checked_only_when_used(mock_load_dotenv, required_env, monkeypatch, caplog):
+    """Test that Jira commands run without Gemini settings."""
+    monkeypatch.delenv('GEMINI_API_KEY')
+    monkeypatch.setattr(config, 'get_config', config.get_config.__wrapped__)
+
+    assert config.get_config()['jira_username'] == 'test_user'
+    with caplog.at_level(logging.ERROR), pytest.raises(SystemExit):
+        config.get_genai.__wrapped__()
+
+    assert "Missing GEMINI_API_KEY" in caplog.text
+
+@patch('dotenv.load_dotenv')
+def test_load_dotenv_skipped_when_environment_complete(mock_load_dotenv, required_env, monkeypatch):
+    """Test that .env is only read when a required setting is missing."""
+    config._load_dotenv()
+    mock_load_dotenv.assert_not_called()
+
+    monkeypatch.delenv('JIRA_USERNAME')
+    config._load_dotenv()
+    mock_load_dotenv.assert_called_once_with(override=True)
+
+@patch('dotenv.load_dotenv')
+def test_load_env_once_reads_files_once(mock_load_dotenv, required_env, monkeypatch, tmp_path):
+    """Test that .env and environment.conf are merged only once."""
+    monkeypatch.setenv('HOME', str(tmp_path))
+    monkeypatch.delenv('GEMINI_MODEL_NAME')
+    config_dir = tmp_path / '.config' / 'jira-thing'
+    config_dir.mkdir(parents=True)
+    (config_dir / 'environment.conf').write_text("[gemini]\nGEMINI_MODEL_NAME=gemini-pro\n")
+
+    config._load_env_once()
+    config._load_env_once()
+    config._load_env_once.cache_clear()
+    config._load_env_once()
+
+    mock_load_dotenv.assert_called_once_with(override=True)
+    assert os.environ['GEMINI_MODEL_NAME'] == 'gemini-pro'
+
+@patch('dotenv.load_dotenv')
+def test_load_env_once_parses_empty_and_colon_values(mock_load_dotenv, required_env, monkeypatch, tmp_path):
+    """Test that an empty value stays on its line and INI 'key: value' lines are read."""
+    monkeypatch.setenv('HOME', str(tmp_path))
+    for key in ('JIRA_USERNAME', 'JIRA_API_TOKEN', 'GEMINI_MODEL_NAME'):
+        monkeypatch.delenv(key)
+    config_dir = tmp_path / '.config' / 'jira-thing'
+    config_dir.mkdir(parents=True)
+    (config_dir / 'environment.conf').write_text(
+        "[jira]\nJIRA_USERNAME=\nJIRA_API_TOKEN=abc\n\n[gemini]\nGEMINI_MODEL_NAME: gemini-pro\n")
+
+    config._load_env_once()
+
+    assert os.environ['JIRA_USERNAME'] == ''
+    assert os.environ['JIRA_API_TOKEN'] == 'abc'
+    assert os.environ['GEMINI_MODEL_NAME'] == 'gemini-pro'
+
+@patch('dotenv.load_dotenv')
+def test_configure_logging_keeps_existing_log_file_handler(mock_load_dotenv, required_env, monkeypatch):
+    """Test that jira_app.log is not given a second handler."""
+    root_logger = logging.getLogger()
+    file_handler = logging.FileHandler(config.LOG_FILE, delay=True)
+    monkeypatch.setattr(root_logger, 'handlers', [file_handler])
+
+    config.configure_logging.__wrapped__()
+
+    assert root_logger.handlers == [file_handler]
+
+def test_dotenv_not_imported_when_environment_complete(required_env, monkeypatch):
+    """Test that python-dotenv is not imported when nothing is missing."""
+    monkeypatch.delitem(sys.modules, 'dotenv', raising=False)
+
+    config._load_dotenv()
+
+    assert 'dotenv' not in sys.modules
+
+@patch('config.atexit.register')
+@patch('dotenv.load_dotenv')
+def test_configure_logging_writes_log_file_through_queue(mock_load_dotenv, mock_register, required_env, monkeypatch, tmp_path):
+    """Test that file records are written by the queue listener."""
+    root_logger = logging.getLogger()
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(root_logger, 'handlers', [])
+    monkeypatch.setattr(root_logger, 'level', root_logger.level)
+    monkeypatch.setattr(config, '_log_listener', None)
+
+    config.configure_logging.__wrapped__()
+    assert not any(isinstance(h, logging.FileHandler) for h in root_logger.handlers)
+    logging.getLogger('test').error("queued record")
+    mock_register.assert_called_once_with(config._log_listener.stop)
+    assert isinstance(config._log_listener.handlers[0], logging.handlers.RotatingFileHandler)
+    config._log_listener.stop()
+
+    assert "queued record" in (tmp_path / config.LOG_FILE).read_text()
+
+@patch('dotenv.load_dotenv')
+def test_get_config_is_read_only(mock_load_dotenv, required_env):
+    """Test that the shared configuration cannot be modified by callers."""
+    settings = config.get_config.__wrapped__()
+
+    assert settings['jira_username'] == 'test_user'
+    with pytest.raises(TypeError):
+        settings['jira_username'] = 'other'
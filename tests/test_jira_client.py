@@ -1,12 +1,51 @@
 #!/usr/bin/env python3
 
+import json
+import logging
+import threading
+import time
 import pytest
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
-from jira_client import JiraManager
+from jira_client import JiraManager, JiraException, REFRESH_EXIT_TIMEOUT, _build_jql
+
+def _issue_json(number):
+    return {
+        'key': f'TEST1-{number}',
+        'fields': {
+            'summary': f'Task {number}',
+            'status': {'name': 'To Do'},
+            'assignee': None,
+            'project': {'key': 'TEST1'},
+            'labels': []
+        }
+    }
+
+class _Project:
+    __slots__ = ('key',)
+
+    def __init__(self, key):
+        self.key = key
+
+class _Fields:
+    __slots__ = ('summary', 'project')
+
+    def __init__(self, summary, project):
+        self.summary = summary
+        self.project = project
+
+class _CreatedIssue:
+    __slots__ = ('key', 'fields')
+
+    def __init__(self, key, fields):
+        self.key = key
+        self.fields = fields
 
 class MockJIRA:
-    def __init__(self, server=None, basic_auth=None):
+    def __init__(self, server=None, basic_auth=None, **options):
         self.current_user = lambda: "test_user"
+        self._session = MagicMock()
+        self._session.get.side_effect = self._get
         # Simulate a successful connection
         import logging
         if server:
@@ -15,51 +54,58 @@ class MockJIRA:
     def current_user(self):
         return "test_user"
 
-    def projects(self):
-        return [
-            type('Project', (), {'key': 'TEST1', 'name': 'Test Project 1'}),
-            type('Project', (), {'key': 'TEST2', 'name': 'Test Project 2'})
-        ]
+    def _get_url(self, path):
+        return f"https://test.atlassian.net/rest/api/2/{path}"
+
+    _is_cloud = False
+    server_url = 'https://test.atlassian.net'
+
+    def _get(self, url, params=None):
+        if url.endswith('/search'):
+            start, size = params['startAt'], params['maxResults']
+            issues = [_issue_json(number) for number in range(start + 1, min(start + size, 120) + 1)]
+            body = {'startAt': start, 'maxResults': size, 'total': 120, 'issues': issues}
+        else:
+            body = [
+                {'key': 'TEST1', 'name': 'Test Project 1', 'id': '10001', 'avatarUrls': {}},
+                {'key': 'TEST2', 'name': 'Test Project 2', 'id': '10002', 'avatarUrls': {}}
+            ]
+        return MagicMock(content=json.dumps(body).encode())
 
     def create_project(self, **kwargs):
-        return type('CreatedProject', (), {
-            'key': 'NEWPROJ', 
-            'name': 'New Project', 
-            'id': '12345'
-        })
+        # POST /project answers with the new project's self URL, id and key
+        return {'self': 'https://test.atlassian.net/rest/api/2/project/12345', 'id': 12345, 'key': kwargs['key']}
 
     def create_issue(self, **kwargs):
-        return type('CreatedIssue', (), {
-            'key': 'TEST-123',
-            'fields': type('Fields', (), {
-                'summary': 'Test Task',
-                'project': type('Project', (), {'key': 'TEST1'})
-            })
-        })
+        return _CreatedIssue('TEST-123', _Fields('Test Task', _Project('TEST1')))
 
 @pytest.fixture
 def mock_config():
     return {
         'jira_server': 'https://test.atlassian.net',
         'jira_username': 'test_user',
-        'jira_token': 'test_token'
+        'jira_token': 'test_token',
+        'jira_projects_ttl': 300,
+        'jira_async_workers': 5
     }
 
-@patch('jira_client.JIRA', MockJIRA)
-@patch('jira_client.config', new_callable=dict)
-def test_jira_manager_initialization(mock_config, caplog):
+@pytest.fixture
+def jira_manager(mock_config):
+    """A JiraManager that connects to MockJIRA."""
+    with patch('jira.JIRA', MockJIRA), patch('jira_client.get_config', return_value=mock_config):
+        yield JiraManager()
+
+@pytest.fixture(autouse=True)
+def cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv('XDG_CACHE_HOME', str(tmp_path))
+    return tmp_path
+
+def test_jira_manager_initialization(jira_manager, caplog):
     """Test JiraManager initialization."""
-    mock_config.update({
-        'jira_server': 'https://test.atlassian.net',
-        'jira_username': 'test_user',
-        'jira_token': 'test_token'
-    })
-    
     # Explicitly set logging level to capture all messages
     import logging
     logging.getLogger().setLevel(logging.DEBUG)
     
-    jira_manager = JiraManager()
     assert jira_manager.client is not None
     
     # Check for log message
@@ -68,60 +114,304 @@ def test_jira_manager_initialization(mock_config, caplog):
         for record in caplog.records
     )
 
-@patch('jira_client.JIRA', MockJIRA)
-@patch('jira_client.config', new_callable=dict)
-def test_get_projects(mock_config):
+@patch('jira_client.get_config')
+def test_jira_manager_connects_with_basic_auth(mock_get_config, mock_config):
+    """Test that the Jira client is created with the configured credentials only."""
+    mock_get_config.return_value = mock_config
+
+    with patch('jira.JIRA', wraps=MockJIRA) as jira_class:
+        JiraManager().client
+
+    assert jira_class.call_args.kwargs == {'server': 'https://test.atlassian.net',
+                                           'basic_auth': ('test_user', 'test_token')}
+
+def test_get_projects(jira_manager):
     """Test retrieving Jira projects."""
-    mock_config.update({
-        'jira_server': 'https://test.atlassian.net',
-        'jira_username': 'test_user',
-        'jira_token': 'test_token'
-    })
-    
-    jira_manager = JiraManager()
     projects = jira_manager.get_projects()
     
     assert len(projects) == 2
     assert projects[0]['key'] == 'TEST1'
     assert projects[0]['name'] == 'Test Project 1'
 
-@patch('jira_client.JIRA', MockJIRA)
-@patch('jira_client.config', new_callable=dict)
-def test_create_project(mock_config):
+def test_create_project(jira_manager):
     """Test creating a new Jira project."""
-    mock_config.update({
-        'jira_server': 'https://test.atlassian.net',
-        'jira_username': 'test_user',
-        'jira_token': 'test_token'
-    })
-    
-    jira_manager = JiraManager()
-    project = jira_manager.create_project("New Project", "NEWPROJ")
+    with patch.object(jira_manager.client, 'create_project', wraps=jira_manager.client.create_project) as create_project:
+        project = jira_manager.create_project("New Project", "NEWPROJ")
     
-    assert project is not None
-    assert project['key'] == 'NEWPROJ'
-    assert project['name'] == 'New Project'
+    assert create_project.call_args.kwargs['assignee'] == "test_user"
+    assert project == {'key': 'NEWPROJ', 'name': 'New Project', 'id': 12345}
 
-@patch('jira_client.JIRA', MockJIRA)
-@patch('jira_client.config', new_callable=dict)
-def test_create_task(mock_config):
+def test_create_task(jira_manager):
     """Test creating a new Jira task."""
-    mock_config.update({
-        'jira_server': 'https://test.atlassian.net',
-        'jira_username': 'test_user',
-        'jira_token': 'test_token'
-    })
-    
-    jira_manager = JiraManager()
-    task = jira_manager.create_task("TEST1", "Test Task")
+    with patch.object(jira_manager.client, 'create_issue', wraps=jira_manager.client.create_issue) as create_issue:
+        task = jira_manager.create_task("TEST1", "Test Task")
     
+    assert create_issue.call_args.kwargs['fields']['project'] == {'key': 'TEST1'}
+    assert create_issue.call_args.kwargs['prefetch'] is False
     assert task is not None
     assert task['key'] == 'TEST-123'
     assert task['summary'] == 'Test Task'
     assert task['project'] == 'TEST1'
 
-def test_jira_manager_connection_failure():
+@patch('jira_client.get_config')
+def test_jira_manager_connection_failure(mock_get_config, mock_config):
     """Test JiraManager initialization failure."""
-    with patch('jira_client.JIRA', side_effect=Exception("Connection failed")):
+    mock_get_config.return_value = mock_config
+    with patch('jira.JIRA', side_effect=Exception("Connection failed")):
         with pytest.raises(RuntimeError, match="Jira client initialization failed: Connection failed"): # Added message matching
-            JiraManager()
+            JiraManager().client
+
+def test_get_projects_failure(jira_manager, caplog):
+    """Test that project retrieval failures raise JiraException, logged without a traceback."""
+    jira_manager.client._session.get.side_effect = Exception("Server error")
+    with caplog.at_level(logging.INFO), pytest.raises(JiraException, match="Failed to retrieve Jira projects: Server error"):
+        jira_manager.get_projects()
+
+    assert not any(record.exc_info for record in caplog.records)
+
+@patch('jira.JIRA', MockJIRA)
+@patch('jira_client.get_config')
+def test_get_projects_uses_disk_cache(mock_get_config, mock_config):
+    """Test that a fresh disk cache is served without calling Jira."""
+    mock_get_config.return_value = mock_config
+
+    jira_manager = JiraManager()
+    first = jira_manager.get_projects()
+    cached_manager = JiraManager()
+    second = cached_manager.get_projects()
+
+    cached_manager.client._session.get.assert_not_called()
+    assert second == first
+    assert second[1] == {'key': 'TEST2', 'name': 'Test Project 2', 'id': '10002'}
+
+def test_get_projects_reuses_in_memory_copy(jira_manager):
+    """Test that repeated calls on one manager skip the disk cache."""
+    first = jira_manager.get_projects()
+    with patch.object(jira_manager, '_read_projects_cache', side_effect=AssertionError("disk read")):
+        second = jira_manager.get_projects()
+
+    assert second is first
+
+@patch('jira.JIRA', MockJIRA)
+@patch('jira_client.get_config')
+def test_get_projects_refreshes_stale_cache(mock_get_config, mock_config):
+    """Test that a stale cache is returned while a refresh is started."""
+    mock_config['jira_projects_ttl'] = 0
+    mock_get_config.return_value = mock_config
+
+    jira_manager = JiraManager()
+    jira_manager.get_projects()
+    with patch('jira_client.threading.Thread') as thread, patch('jira_client.atexit.register') as register:
+        projects = jira_manager.get_projects()
+
+    assert projects[0]['key'] == 'TEST1'
+    thread.assert_called_once_with(target=jira_manager._refresh_projects_cache, daemon=True)
+    thread.return_value.start.assert_called_once_with()
+    register.assert_called_once_with(thread.return_value.join, REFRESH_EXIT_TIMEOUT)
+
+@patch('jira.JIRA', MockJIRA)
+@patch('jira_client.get_config')
+def test_get_projects_stale_refresh_rewrites_cache(mock_get_config, mock_config):
+    """Test that the background refresh replaces the stale cache file."""
+    mock_config['jira_projects_ttl'] = 0
+    mock_get_config.return_value = mock_config
+
+    jira_manager = JiraManager()
+    jira_manager._write_projects_cache([{'key': 'OLD', 'name': 'Old Project', 'id': '1'}])
+    with patch('jira_client.atexit.register') as register:
+        projects = jira_manager.get_projects()
+        # Run the exit hook as the interpreter would
+        join, timeout = register.call_args.args
+        join(timeout)
+
+    assert projects[0]['key'] == 'OLD'
+    assert [project['key'] for project in jira_manager._read_projects_cache()[0]] == ['TEST1', 'TEST2']
+
+@patch('jira.JIRA', MockJIRA)
+@patch('jira_client.REFRESH_EXIT_TIMEOUT', 0.1)
+@patch('jira_client.get_config')
+def test_get_projects_stale_refresh_does_not_block_exit(mock_get_config, mock_config):
+    """Test that the exit hook gives up on a hung refresh after REFRESH_EXIT_TIMEOUT."""
+    mock_config['jira_projects_ttl'] = 0
+    mock_get_config.return_value = mock_config
+    released = threading.Event()
+
+    jira_manager = JiraManager()
+    jira_manager._write_projects_cache([{'key': 'OLD', 'name': 'Old Project', 'id': '1'}])
+    with patch.object(jira_manager, '_refresh_projects_cache', side_effect=released.wait), \
+            patch('jira_client.atexit.register') as register:
+        jira_manager.get_projects()
+        join, timeout = register.call_args.args
+        started = time.monotonic()
+        join(timeout)
+        elapsed = time.monotonic() - started
+
+    assert elapsed < 1
+    assert jira_manager._projects_refresh.daemon and jira_manager._projects_refresh.is_alive()
+    released.set()
+
+@patch('jira.JIRA', MockJIRA)
+@patch('jira_client.get_config')
+def test_get_projects_cache_is_per_server(mock_get_config, mock_config):
+    """Test that a cache written for another server is ignored."""
+    mock_get_config.return_value = mock_config
+    JiraManager().get_projects()
+
+    mock_get_config.return_value = dict(mock_config, jira_server='https://other.atlassian.net')
+    jira_manager = JiraManager()
+    assert jira_manager._read_projects_cache() is None
+
+def test_create_project_invalidates_projects_cache(jira_manager):
+    """Test that creating a project drops the cached project list."""
+    jira_manager.get_projects()
+    jira_manager.create_project("New Project", "NEWPROJ")
+
+    assert jira_manager._read_projects_cache() is None
+    jira_manager.get_projects()
+    assert jira_manager.client._session.get.call_count == 2
+
+@patch('jira_client.get_config')
+def test_jira_manager_uses_at_least_one_worker(mock_get_config, mock_config):
+    """Test that a zero worker count still gives usable thread pools."""
+    mock_config['jira_async_workers'] = 0
+    mock_get_config.return_value = mock_config
+
+    assert JiraManager().async_workers == 1
+
+@patch('jira_client.get_config')
+def test_jira_manager_grows_connection_pool_for_workers(mock_get_config, mock_config):
+    """Test that the shared session can hold a connection per async worker."""
+    import requests
+    mock_config['jira_async_workers'] = 32
+    mock_get_config.return_value = mock_config
+
+    class SessionJIRA(MockJIRA):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self._session = requests.Session()
+
+    with patch('jira.JIRA', SessionJIRA):
+        client = JiraManager().client
+
+    assert client._session.get_adapter(mock_config['jira_server'])._pool_maxsize == 32
+
+@patch('jira_client.get_config')
+def test_jira_manager_caches_current_user(mock_get_config, mock_config):
+    """Test that the connection check is skipped for recently verified credentials."""
+    mock_get_config.return_value = mock_config
+    calls = []
+
+    class CountingJIRA(MockJIRA):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, **kwargs)
+            self.current_user = lambda: calls.append(1) or "test_user"
+
+    with patch('jira.JIRA', CountingJIRA):
+        JiraManager()._current_user
+        cached = JiraManager()._current_user
+        JiraManager(use_cache=False)._current_user
+        mock_config['jira_token'] = 'other-token'
+        JiraManager()._current_user
+
+    assert cached == "test_user"
+    assert len(calls) == 3
+
+def test_get_tasks_fetches_remaining_pages(jira_manager):
+    """Test that every search page is fetched and kept in order."""
+    tasks = jira_manager.get_tasks(project_key='TEST1', status='To Do')
+
+    searches = [call.kwargs['params'] for call in jira_manager.client._session.get.call_args_list]
+    assert sorted(params['startAt'] for params in searches) == [0, 100]
+    assert searches[0]['fields'] == 'summary,status,assignee,project,labels'
+    assert [task.key for task in tasks] == [f'TEST1-{number}' for number in range(1, 121)]
+    assert tasks[0].assignee == 'Unassigned'
+
+def test_get_tasks_without_filters_skips_jql_builder(jira_manager):
+    """Test that an unfiltered listing searches with empty JQL without building it."""
+    with patch('jira_client._build_jql', side_effect=AssertionError("built")):
+        tasks = jira_manager.get_tasks()
+
+    assert len(tasks) == 120
+    assert jira_manager.client._session.get.call_args.kwargs['params']['jql'] == ''
+
+def test_get_tasks_bulk_searches_each_query_once(jira_manager):
+    """Test that queries building the same JQL share one search."""
+    with patch('jira_client.ThreadPoolExecutor', wraps=ThreadPoolExecutor) as executor:
+        results = jira_manager.get_tasks_bulk([
+            {'project_key': 'TEST1', 'labels': ['a', 'b']},
+            {'project_key': 'TEST1', 'labels': ['b', 'a']},
+            {'project_key': 'TEST2'},
+        ])
+
+    assert list(results) == [_build_jql('TEST1', None, ('a', 'b'), None, None),
+                             _build_jql('TEST2', None, (), None, None)]
+    assert all(len(tasks) == 120 for tasks in results.values())
+    assert jira_manager.client._session.get.call_count == 4
+    # Pages are fetched on the query workers, not on a pool per query
+    executor.assert_called_once_with(max_workers=5)
+
+def test_get_tasks_follows_cloud_page_tokens(jira_manager):
+    """Test that Jira Cloud results are paged with nextPageToken."""
+    pages = {
+        None: {'issues': [_issue_json(1)], 'nextPageToken': 'page-2'},
+        'page-2': {'issues': [_issue_json(2)], 'isLast': True}
+    }
+
+    jira_manager.client._is_cloud = True
+    jira_manager.client._session.get.side_effect = lambda url, params: MagicMock(
+        content=json.dumps(pages[params['nextPageToken']]).encode())
+    tasks = jira_manager.get_tasks(project_key='TEST1', status='To Do')
+
+    assert [task.key for task in tasks] == ['TEST1-1', 'TEST1-2']
+
+def test_get_statuses_caches_project_statuses(jira_manager):
+    """Test that project statuses are grouped by issue type and fetched once."""
+    session = jira_manager.client._session
+    session.get.side_effect = None
+    session.get.return_value.content = json.dumps([
+        {'name': 'Task', 'statuses': [{'id': '1', 'name': 'To Do', 'statusCategory': {'name': 'To Do'}}]}
+    ]).encode()
+    first = jira_manager.get_statuses('TEST1')
+    second = jira_manager.get_statuses('TEST1')
+
+    assert first == [{'id': '1', 'name': 'To Do', 'description': '', 'issue_type': 'Task', 'category': 'To Do'}]
+    assert second is first
+    session.get.assert_called_once_with('https://test.atlassian.net/rest/api/2/project/TEST1/statuses')
+
+    jira_manager.invalidate_status_cache('TEST1')
+    jira_manager.get_statuses('TEST1')
+    assert session.get.call_count == 2
+
+@patch('jira_client.get_config')
+def test_jira_manager_connects_on_first_use(mock_get_config, mock_config):
+    """Test that a cached project list is served without connecting to Jira."""
+    mock_get_config.return_value = mock_config
+    with patch('jira.JIRA', MockJIRA):
+        JiraManager().get_projects()
+
+    with patch('jira.JIRA', side_effect=AssertionError("connected")):
+        jira_manager = JiraManager()
+        jira_manager.get_projects()
+        jira_manager.close()
+
+    assert 'client' not in jira_manager.__dict__
+
+def test_build_jql_escapes_values():
+    """Test that JQL values are escaped and equal filters reuse one query string."""
+    jql = _build_jql('TEST1', None, ('a', "it's"), None, 'To Do')
+
+    assert jql == "project = 'TEST1' AND labels = 'a' AND labels = 'it\\'s' AND status = 'To Do'"
+    assert _build_jql('TEST1', None, ('a', "it's"), None, 'To Do') is jql
+
+def test_get_tasks_lists_valid_statuses_on_status_error(jira_manager, capsys):
+    """Test that a rejected status prints the project's statuses from get_statuses."""
+    jira_manager.client._session.get.side_effect = Exception(
+        "The value 'Doing' does not exist for the field 'status'.")
+    statuses = [{'name': 'To Do', 'issue_type': 'Task'}, {'name': 'To Do', 'issue_type': 'Bug'},
+                {'name': 'Done', 'issue_type': 'Task'}]
+    with patch.object(jira_manager, 'get_statuses', return_value=statuses) as get_statuses:
+        with pytest.raises(Exception, match="does not exist"):
+            jira_manager.get_tasks(project_key='TEST1', status='Doing')
+
+    get_statuses.assert_called_once_with('TEST1')
+    assert capsys.readouterr().out == "Valid statuses for this project:\nTo Do\nDone\n"
@@ -0,0 +1,32 @@
+#!/usr/bin/env python3
+
+import pytest
+from unittest.mock import patch
+import main
+
+@pytest.mark.parametrize('argv, path', [
+    (['jira', 'task', 'create', '--help'], 'jira task create'),
+    (['jira', 'task', 'help'], 'jira task'),
+    (['jira', 'task', 'create', '--summary', 'X', '-h'], 'jira task create'),
+    (['jira', 'project', 'list', '--no-cache', 'help'], 'jira project list'),
+])
+def test_main_answers_trailing_help(argv, path, monkeypatch):
+    """Test that a trailing help token shows the help for the command path."""
+    monkeypatch.setattr('sys.argv', ['main.py'] + argv)
+    with patch('main.display_help_summary') as display_help_summary, pytest.raises(SystemExit):
+        main.main()
+
+    display_help_summary.assert_called_once_with(path)
+
+def test_main_treats_help_after_option_as_its_value(monkeypatch):
+    """Test that 'help' given as an option value runs the command."""
+    argv = ['jira', 'task', 'create', '--project', 'X', '--summary', 'help']
+    monkeypatch.setattr('sys.argv', ['main.py'] + argv)
+    monkeypatch.setattr('cli._jira_manager', None)
+    with patch('main.display_help_summary') as display_help_summary, \
+            patch('main.configure_logging'), \
+            patch('jira_client.JiraManager') as manager_class:
+        main.main()
+
+    display_help_summary.assert_not_called()
+    assert manager_class.return_value.create_task.call_args.kwargs['summary'] == 'help'